@@ -46,6 +46,9 @@ DEFAULT_CONFIG = {
     ],
     "spotify_cache_tokens": True,
     "spotify_auto_refresh": True,
+    "spotify_max_concurrency": 10,
+    "spotify_rps": 20,
+    "spotify_http_cache": True,
 }
 
 # Profile definitions
@@ -140,6 +143,7 @@ CONFIG_SCHEMA = {
     "spotify_scopes": {"type": list, "required": False, "element_type": str},
     "spotify_cache_tokens": {"type": bool, "required": False},
     "spotify_auto_refresh": {"type": bool, "required": False},
+    "spotify_http_cache": {"type": bool, "required": False},
 }
 
 
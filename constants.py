@@ -26,6 +26,9 @@ AUDIO_BITRATE_OPTIONS = {
 
 # Files
 
+# Every casing of ".csv", so directory scans can use str.endswith without lowercasing each name
+CSV_SUFFIXES = (".csv", ".CSV", ".Csv", ".cSv", ".csV", ".CSv", ".CsV", ".cSV")
+
 FAILED_FILE = "data/failed_downloads.json"
 PROGRESS_FILE = "data/download_progress.json"
 LOG_FILE = "app.log"
\ No newline at end of file
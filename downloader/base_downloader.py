@@ -3,14 +3,13 @@ import subprocess
 import time
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from utils import log_info, log_success, log_error, log_warning
+from utils import log_info, log_success, log_error, log_warning, sanitize_filename
 from tqdm import tqdm
 
 
 def _get_base_filename(artist: str, track: str) -> str:
     """Generate the base filename used by yt-dlp for consistent metadata embedding."""
-    query = f"{artist} - {track}"
-    return query.replace("/", "-")
+    return sanitize_filename(artist, track)
 
 
 def _embed_metadata_after_download(
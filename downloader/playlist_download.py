@@ -1,6 +1,7 @@
 import os
 import json
 from utils.logger import log_info, log_error, log_success
+from utils.track_checker import resolve_playlist_dir
 from downloader.base_downloader import batch_download
 
 """
@@ -8,8 +9,7 @@ Downloads all pending tracks for a given playlist.
 Creates the playlist folder if it doesn't exist.
 """
 async def download_playlist(playlist_name, tracks, output_dir, audio_format, sleep_between):
-    sanitized_name = playlist_name.replace("/", "-").strip()
-    playlist_dir = os.path.join(output_dir, sanitized_name)
+    playlist_dir = resolve_playlist_dir(output_dir, playlist_name)
 
     os.makedirs(playlist_dir, exist_ok=True)
 
@@ -4,6 +4,7 @@ import shutil
 from datetime import datetime
 from typing import Optional, List
 from utils.logger import log_info, log_warning, log_error
+from utils.loaders import load_tracks_log, tracks_log_path
 
 # Default backup directory
 BACKUP_DIR = "data/backups"
@@ -23,6 +24,23 @@ def ensure_backup_dir():
         os.makedirs(BACKUP_DIR, exist_ok=True)
 
 
+def _copy_with_tracks_log(filepath: str, backup_path: str):
+    """Copy filepath to backup_path, folding in tracks appended to its NDJSON log by sync.
+
+    Without this a tracks.json backup would miss every track synced since the last compaction.
+    """
+    if not os.path.exists(tracks_log_path(filepath)):
+        shutil.copy2(filepath, backup_path)
+        return
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    base_tracks = list(data.get("tracks", []))
+    data["tracks"] = base_tracks + load_tracks_log(filepath, base_tracks)
+    with open(backup_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
 def backup_json_file(filepath: str, config: dict = None) -> Optional[str]:
     """
     Create a timestamped backup of a JSON file.
@@ -51,7 +69,7 @@ def backup_json_file(filepath: str, config: dict = None) -> Optional[str]:
     backup_path = os.path.join(BACKUP_DIR, backup_name)
     
     try:
-        shutil.copy2(filepath, backup_path)
+        _copy_with_tracks_log(filepath, backup_path)
         log_info(f"Created backup: {backup_name}")
         
         # Enforce max backup limit if config provided
@@ -195,6 +213,11 @@ def restore_backup(backup_path: str, target_path: str) -> bool:
         
         # Restore the backup
         shutil.copy2(backup_path, target_path)
+
+        # Backups already include logged tracks; a leftover log would replay stale entries on top.
+        log_path = tracks_log_path(target_path)
+        if os.path.exists(log_path):
+            os.remove(log_path)
         log_info(f"Restored backup: {os.path.basename(backup_path)} -> {target_path}")
         return True
     
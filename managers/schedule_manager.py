@@ -9,22 +9,44 @@ from utils.loaders import load_primary_tracks
 def schedule_download(config):
     time_str = input("Enter time to schedule download (HH:MM, 24h): ").strip()
 
+    # One event loop for the lifetime of the scheduler instead of a fresh loop per run.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     def job():
         from utils.track_checker import check_downloaded_files
 
-        tracks = load_primary_tracks(config)
-        _, pending = check_downloaded_files(config["output_dir"], tracks)
-        if not pending:
-            log_info("No pending downloads for scheduled job.")
-            return
-        log_info("Starting scheduled batch download...")
-        asyncio.run(batch_download(pending, config["output_dir"], config["audio_format"]))
+        try:
+            tracks = load_primary_tracks(config)
+            _, pending = check_downloaded_files(config["output_dir"], tracks)
+            if not pending:
+                log_info("No pending downloads for scheduled job.")
+                return
+            log_info("Starting scheduled batch download...")
+            loop.run_until_complete(batch_download(pending, config["output_dir"], config["audio_format"]))
+        except Exception as e:
+            # A failing run must not end the scheduler loop.
+            log_error(f"Scheduled download failed: {e}")
 
+    scheduled = None
     try:
-        schedule.every().day.at(time_str).do(job)
+        scheduled = schedule.every().day.at(time_str).do(job)
         log_info(f"Scheduled daily download at {time_str}. Press Ctrl+C to stop.")
         while True:
+            # Sleep until the next job is due instead of polling every second.
+            delay = schedule.idle_seconds()
+            if delay is None:
+                break
+            if delay > 0:
+                time.sleep(delay)
             schedule.run_pending()
-            time.sleep(1)
+    except KeyboardInterrupt:
+        log_info("Download scheduler stopped")
     except Exception as e:
         log_error(f"Error scheduling download: {e}")
+    finally:
+        # The job lives on the global scheduler and uses this loop; drop it before the loop closes.
+        if scheduled is not None:
+            schedule.cancel_job(scheduled)
+        asyncio.set_event_loop(None)
+        loop.close()
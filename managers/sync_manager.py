@@ -1,82 +1,315 @@
 import os
 import json
+import mmap
+import sys
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+from constants import CSV_SUFFIXES
 from utils.logger import log_info, log_warning, log_error
-from utils.loaders import load_exportify_tracks
+from utils.loaders import load_exportify_tracks, load_tracks_log, tracks_log_path
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None  # type: ignore[assignment]
 
 # State file to track synced files
 SYNC_STATE_FILE = "data/sync_state.json"
 
+# Rewrite tracks.json (and truncate its append log) once the log exceeds this share of it
+TRACKS_LOG_COMPACT_RATIO = 0.25
+
+
+def _blake2b_128():
+    return hashlib.blake2b(digest_size=16)
+
 
 def get_file_hash(filepath: str) -> str:
-    """Calculate MD5 hash of a file for change detection."""
-    hasher = hashlib.md5()
+    """Calculate a fast, non-cryptographic content hash of a file for change detection.
+
+    Uses BLAKE3 when installed: the file is memory-mapped and hashed in a single call.
+    Otherwise falls back to BLAKE2b, using hashlib.file_digest (Python 3.11+) so the
+    read loop runs in C, or a reused 1 MiB readinto() buffer on older Pythons.
+
+    Hashes from the previous MD5 implementation never match these digests, so files
+    recorded with an old MD5 hash are simply treated as changed once and re-synced.
+    """
     with open(filepath, "rb") as f:
-        buf = f.read(65536)
-        while buf:
-            hasher.update(buf)
-            buf = f.read(65536)
-    return hasher.hexdigest()
+        if blake3 is not None:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            # mmap cannot map empty files.
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            return hasher.hexdigest(length=16)
+
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, _blake2b_128).hexdigest()
+
+        hasher = _blake2b_128()
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        n = f.readinto(buf)
+        while n:
+            hasher.update(view[:n])
+            n = f.readinto(buf)
+        return hasher.hexdigest()
+
+
+# Raw bytes of sync_state.json, reused while the file on disk is unchanged. Bytes rather than
+# the parsed dict: callers mutate the state they get, and reparsing is cheaper than a deepcopy.
+_STATE_CACHE = {"key": None, "raw": None}
+
+
+def _state_file_key() -> Optional[tuple]:
+    try:
+        st = os.stat(SYNC_STATE_FILE)
+    except OSError:
+        return None
+    return (SYNC_STATE_FILE, st.st_mtime_ns, st.st_size)
+
+
+def _loads_state(raw: bytes) -> dict:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def load_sync_state() -> dict:
-    """Load the sync state from file."""
-    if not os.path.exists(SYNC_STATE_FILE):
+    """Load the sync state from file (the file is not re-read while it is unchanged on disk)."""
+    key = _state_file_key()
+    if key is None:
         return {"synced_files": {}, "last_sync": None}
 
+    if _STATE_CACHE["key"] != key:
+        try:
+            with open(SYNC_STATE_FILE, "rb") as f:
+                raw = f.read()
+            data = _loads_state(raw)
+        except (ValueError, IOError):
+            return {"synced_files": {}, "last_sync": None}
+        _STATE_CACHE["key"] = key
+        _STATE_CACHE["raw"] = raw
+        return data
+
     try:
-        with open(SYNC_STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _loads_state(_STATE_CACHE["raw"])
+    except ValueError:
         return {"synced_files": {}, "last_sync": None}
 
 
 def save_sync_state(state: dict):
-    """Save the sync state to file."""
+    """Save the sync state to file (atomically, via a temp file + rename)."""
     os.makedirs(os.path.dirname(SYNC_STATE_FILE), exist_ok=True)
-    with open(SYNC_STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    tmp_path = f"{SYNC_STATE_FILE}.tmp"
+    if orjson is not None:
+        raw = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(state, indent=2).encode("utf-8")
+    with open(tmp_path, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, SYNC_STATE_FILE)
+
+    _STATE_CACHE["key"] = _state_file_key()
+    _STATE_CACHE["raw"] = raw
+
+
+class SyncStateCache:
+    """In-memory sync state that is mutated per file and written back once per batch."""
+
+    def __init__(self, state: Optional[dict] = None):
+        self.state = state if state is not None else load_sync_state()
+        self.state.setdefault("synced_files", {})
+        self.dirty = False
+
+    @property
+    def synced_files(self) -> dict:
+        return self.state["synced_files"]
+
+    def mark(self, filename: str, file_hash: str, fingerprint: dict):
+        """Record a file as synced with its content hash and stat fingerprint."""
+        self.synced_files[filename] = {
+            "hash": file_hash,
+            **fingerprint,
+            "synced_at": datetime.now().isoformat(),
+        }
+        self.dirty = True
+
+    def refresh(self, filename: str, fingerprint: dict):
+        """Update only the stat fingerprint of an already-synced file."""
+        self.synced_files[filename].update(fingerprint)
+        self.dirty = True
+
+    def set_last_sync(self):
+        self.state["last_sync"] = datetime.now().isoformat()
+        self.dirty = True
+
+    def flush(self) -> bool:
+        """Write the state to disk if anything changed. Returns True if a write happened."""
+        if not self.dirty:
+            return False
+        save_sync_state(self.state)
+        self.dirty = False
+        return True
+
+
+def _track_id(artist: str, title: str) -> int:
+    """64-bit dedup key for an (artist, title) pair, compared case-insensitively.
+
+    Only used for in-memory dedup within one sync, so the per-process salted
+    builtin hash() is a fine fallback when xxhash is not installed.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(f"{artist.casefold()}\0{title.casefold()}".encode("utf-8"))
+    return hash((artist.casefold(), title.casefold()))
+
 
+def _prefetch_files(filepaths: List[str]):
+    """Ask the kernel to start readahead for every file up front (Linux/POSIX only).
 
-def detect_new_files(exportify_dir: str) -> List[dict]:
+    All reads are queued to the block layer at once, so the hashing workers find the
+    pages already in (or on their way to) the page cache.
     """
-    Detect new or modified CSV files in the exportify directory.
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for filepath in filepaths:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _stat_fingerprint(st: os.stat_result) -> dict:
+    """Return the (size, mtime_ns) fingerprint stored alongside each file hash."""
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _scan_exportify_dir(exportify_dir: str, synced_files: dict) -> Tuple[List[dict], dict]:
+    """
+    Scan the exportify directory for new or modified CSV files.
+
+    Files whose size and mtime match the recorded fingerprint are skipped without
+    being read. Files whose fingerprint changed but whose content hash did not
+    (e.g. touched or copied over) are returned separately so the caller can
+    refresh the stored fingerprint.
 
     Returns:
-        List of dicts with file info for new/modified files
+        (new_files, refreshed) where refreshed maps filename -> fingerprint
     """
-    if not os.path.exists(exportify_dir):
-        return []
+    candidates = []
 
-    state = load_sync_state()
-    synced_files = state.get("synced_files", {})
+    with os.scandir(exportify_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(CSV_SUFFIXES) or not entry.is_file():
+                continue
+
+            fingerprint = _stat_fingerprint(entry.stat())
+            synced = synced_files.get(entry.name) or {}
+
+            # Unchanged size + mtime: skip hashing entirely.
+            if synced.get("size") == fingerprint["size"] and synced.get("mtime_ns") == fingerprint["mtime_ns"]:
+                continue
+
+            candidates.append((entry.name, entry.path, fingerprint))
+
+    if not candidates:
+        return [], {}
+
+    filepaths = [filepath for _, filepath, _ in candidates]
+    _prefetch_files(filepaths)
+
+    # Hashing is read-bound and releases the GIL, so changed files are hashed concurrently.
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+        hashes = list(executor.map(get_file_hash, filepaths))
 
     new_files = []
+    refreshed = {}
 
-    for filename in os.listdir(exportify_dir):
-        if not filename.lower().endswith(".csv"):
+    for (filename, filepath, fingerprint), current_hash in zip(candidates, hashes):
+        # Same content, new fingerprint: nothing to sync.
+        if (synced_files.get(filename) or {}).get("hash") == current_hash:
+            refreshed[filename] = fingerprint
             continue
 
-        filepath = os.path.join(exportify_dir, filename)
-        current_hash = get_file_hash(filepath)
-
-        # Check if file is new or modified
-        if filename not in synced_files or synced_files[filename]["hash"] != current_hash:
-            new_files.append(
-                {
-                    "filename": filename,
-                    "filepath": filepath,
-                    "hash": current_hash,
-                    "is_new": filename not in synced_files,
-                }
-            )
+        new_files.append(
+            {
+                "filename": filename,
+                "filepath": filepath,
+                "hash": current_hash,
+                "is_new": filename not in synced_files,
+                **fingerprint,
+            }
+        )
+
+    return new_files, refreshed
+
+
+def detect_new_files(exportify_dir: str, state: Optional[dict] = None) -> List[dict]:
+    """
+    Detect new or modified CSV files in the exportify directory.
+
+    Args:
+        exportify_dir: Folder containing Exportify CSVs
+        state: Already-loaded sync state (loaded from disk when omitted)
+
+    Returns:
+        List of dicts with file info for new/modified files
+    """
+    if not os.path.exists(exportify_dir):
+        return []
 
+    if state is None:
+        state = load_sync_state()
+    new_files, _ = _scan_exportify_dir(exportify_dir, state.get("synced_files", {}))
     return new_files
 
 
+def _append_tracks_log(tracks_file: str, tracks: Iterable[dict]):
+    """Append tracks to the NDJSON log next to tracks_file, with a single fsync."""
+    log_path = tracks_log_path(tracks_file)
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    with open(log_path, "a", encoding="utf-8") as f:
+        for track in tracks:
+            f.write(json.dumps(track) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _compact_tracks_file(tracks_file: str, tracks: List[dict]):
+    """Rewrite tracks_file with every track and drop the append log."""
+    os.makedirs(os.path.dirname(tracks_file) or ".", exist_ok=True)
+    tmp_path = f"{tracks_file}.tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({"tracks": tracks}, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"tracks": tracks}, f, indent=2)
+    os.replace(tmp_path, tracks_file)
+
+    log_path = tracks_log_path(tracks_file)
+    if os.path.exists(log_path):
+        os.remove(log_path)
+
+
 def sync_exportify_folder(config: dict) -> dict:
     """
     Sync the exportify folder.
@@ -88,7 +321,9 @@ def sync_exportify_folder(config: dict) -> dict:
 
     Backward compatibility:
     - If tracks_file is a JSON file AND sync_write_tracks_json is enabled,
-      this will also merge new tracks into tracks.json.
+      this will also merge new tracks into tracks.json. New tracks are appended
+      to a sibling NDJSON log; tracks.json itself is only rewritten when that
+      log grows past TRACKS_LOG_COMPACT_RATIO of it.
     """
     exportify_dir = config.get("exportify_watch_folder", "data/exportify")
     tracks_file = config.get("tracks_file", "data/tracks.json")
@@ -114,52 +349,66 @@ def sync_exportify_folder(config: dict) -> dict:
         results["errors"].append(f"Directory not found: {exportify_dir}")
         return results
 
+    # Load sync state
+    state = SyncStateCache()
+
     # Detect new/modified files
-    new_files = detect_new_files(exportify_dir)
+    new_files, refreshed = _scan_exportify_dir(exportify_dir, state.synced_files)
+
+    # Content unchanged: only record the new stat fingerprint so the next scan skips hashing.
+    for filename, fingerprint in refreshed.items():
+        state.refresh(filename, fingerprint)
 
     if not new_files:
+        state.flush()
         log_info("No new or modified files to sync")
         return results
 
     log_info(f"Found {len(new_files)} file(s) to sync")
 
     # Load existing tracks only if we are updating tracks.json
-    existing_tracks = []
-    existing_ids = set()
+    base_tracks = []
+    logged_tracks = []
+    # New tracks are collected column-wise; dicts are only built while writing them out.
+    new_artists, new_albums, new_titles, new_uris = [], [], [], []
 
-    if should_update_tracks_json and os.path.exists(tracks_file):
-        # Backup tracks.json before modifying
-        if auto_backup:
+    def iter_new_tracks():
+        for artist, album, title, uri in zip(new_artists, new_albums, new_titles, new_uris):
+            yield {"artist": artist, "album": album, "track": title, "uri": uri}
+
+    if should_update_tracks_json:
+        if os.path.exists(tracks_file):
             try:
-                from managers.backup_manager import backup_json_file
+                if orjson is not None:
+                    with open(tracks_file, "rb") as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(tracks_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                base_tracks = data.get("tracks", [])
+            except (json.JSONDecodeError, IOError):
+                base_tracks = []
 
-                backup_json_file(tracks_file, config)
-            except ImportError:
-                pass
+        logged_tracks = load_tracks_log(tracks_file, base_tracks)
 
-        try:
-            with open(tracks_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                existing_tracks = data.get("tracks", [])
-        except (json.JSONDecodeError, IOError):
-            existing_tracks = []
+    existing_tracks = base_tracks + logged_tracks
 
     # Create set of existing track identifiers for deduplication
-    for t in existing_tracks:
-        track_id = f"{t.get('artist', '').casefold()}|{t.get('track', '').casefold()}"
-        existing_ids.add(track_id)
+    existing_ids = {_track_id(t.get("artist", ""), t.get("track", "")) for t in existing_tracks}
 
-    # Load sync state
-    state = load_sync_state()
+    # Parse the new files concurrently (at most 5 at a time); merging below stays
+    # single-threaded so existing_ids needs no locking.
+    with ThreadPoolExecutor(max_workers=min(5, len(new_files))) as executor:
+        parsed = [executor.submit(load_exportify_tracks, file_info["filepath"]) for file_info in new_files]
 
     # Process each new file directly
-    for file_info in new_files:
+    for file_info, future in zip(new_files, parsed):
         try:
-            csv_tracks = load_exportify_tracks(file_info["filepath"])
+            csv_tracks = future.result()
 
             added_count = 0
             for track in csv_tracks:
-                track_id = f"{track.get('artist', '').casefold()}|{track.get('track', '').casefold()}"
+                track_id = _track_id(track.get("artist", ""), track.get("track", ""))
                 if track_id in existing_ids:
                     continue
 
@@ -167,23 +416,20 @@ def sync_exportify_folder(config: dict) -> dict:
                 added_count += 1
 
                 if should_update_tracks_json:
-                    existing_tracks.append(
-                        {
-                            "artist": track.get("artist", ""),
-                            "album": track.get("album", ""),
-                            "track": track.get("track", ""),
-                            "uri": track.get("uri", ""),
-                        }
-                    )
+                    new_artists.append(track.get("artist", ""))
+                    new_albums.append(track.get("album", ""))
+                    new_titles.append(track.get("track", ""))
+                    new_uris.append(track.get("uri", ""))
 
             results["new_tracks"] += added_count
             log_info(f"Synced {file_info['filename']}: {added_count} new tracks")
 
             # Update sync state for this file
-            state["synced_files"][file_info["filename"]] = {
-                "hash": file_info["hash"],
-                "synced_at": datetime.now().isoformat(),
-            }
+            state.mark(
+                file_info["filename"],
+                file_info["hash"],
+                {"size": file_info["size"], "mtime_ns": file_info["mtime_ns"]},
+            )
 
             if file_info["is_new"]:
                 results["new_files"] += 1
@@ -198,9 +444,25 @@ def sync_exportify_folder(config: dict) -> dict:
     # Save updated tracks.json (optional)
     if should_update_tracks_json:
         try:
-            os.makedirs(os.path.dirname(tracks_file) or ".", exist_ok=True)
-            with open(tracks_file, "w", encoding="utf-8") as f:
-                json.dump({"tracks": existing_tracks}, f, indent=2)
+            logged_count = len(logged_tracks) + len(new_artists)
+            compact = logged_count > TRACKS_LOG_COMPACT_RATIO * len(base_tracks)
+
+            # Backup tracks.json (with its log folded in) before changing either
+            if auto_backup and (new_artists or compact) and os.path.exists(tracks_file):
+                try:
+                    from managers.backup_manager import backup_json_file
+
+                    backup_json_file(tracks_file, config)
+                except ImportError:
+                    pass
+
+            if new_artists:
+                _append_tracks_log(tracks_file, iter_new_tracks())
+
+            if compact:
+                existing_tracks.extend(iter_new_tracks())
+                _compact_tracks_file(tracks_file, existing_tracks)
+
             results["tracks_file_updated"] = True
             log_info(f"Updated {tracks_file} with {results['new_tracks']} new tracks")
         except IOError as e:
@@ -214,8 +476,8 @@ def sync_exportify_folder(config: dict) -> dict:
         )
 
     # Save sync state
-    state["last_sync"] = datetime.now().isoformat()
-    save_sync_state(state)
+    state.set_last_sync()
+    state.flush()
 
     return results
 
@@ -232,25 +494,50 @@ def schedule_sync(config: dict, interval_seconds: Optional[int] = None):
 
     interval = interval_seconds or config.get("auto_sync_interval", 3600)
 
-    def sync_job():
-        log_info("Running scheduled sync...")
-        results = sync_exportify_folder(config)
+    # A single worker runs syncs off the scheduler thread, one at a time.
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def log_sync_result(future):
+        try:
+            results = future.result()
+        except Exception as e:
+            log_error(f"Scheduled sync failed: {e}")
+            return
         if results["new_tracks"] > 0:
             log_info(f"Scheduled sync complete: {results['new_tracks']} new tracks added")
         else:
             log_info("Scheduled sync complete: no new tracks")
 
+    def sync_job():
+        log_info("Running scheduled sync...")
+        try:
+            executor.submit(sync_exportify_folder, config).add_done_callback(log_sync_result)
+        except Exception as e:
+            # A failing run must not end the scheduler loop.
+            log_error(f"Scheduled sync failed: {e}")
+
     # Schedule recurring sync
-    schedule.every(interval).seconds.do(sync_job)
+    job = schedule.every(interval).seconds.do(sync_job)
 
     log_info(f"Sync scheduled every {interval} seconds. Press Ctrl+C to stop.")
 
     try:
         while True:
+            # Sleep until the next job is due instead of polling every second.
+            delay = schedule.idle_seconds()
+            if delay is None:
+                break
+            if delay > 0:
+                time.sleep(delay)
             schedule.run_pending()
-            time.sleep(1)
     except KeyboardInterrupt:
         log_info("Sync scheduler stopped")
+    finally:
+        # The job lives on the global scheduler; drop it before its executor goes away so a
+        # later scheduler in this session does not fire it.
+        schedule.cancel_job(job)
+        # Let an in-progress sync finish so sync_state.json is not left half-updated.
+        executor.shutdown(wait=True)
 
 
 def run_sync_once(config: dict) -> dict:
@@ -277,7 +564,7 @@ def get_sync_status(config: dict) -> dict:
     }
 
     # Check for pending files
-    pending = detect_new_files(exportify_dir)
+    pending = detect_new_files(exportify_dir, state)
     status["pending_files"] = [f["filename"] for f in pending]
     status["pending_count"] = len(pending)
 
@@ -1,17 +1,21 @@
 import asyncio
+import importlib
 import os
+import sys
 import time
 import webbrowser
 import threading
 import urllib.parse
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import questionary
 
 from utils.logger import log_info, log_warning, log_error
 from utils.track_checker import (
     check_downloaded_files,
-    existing_track_keys_in_dir,
+    count_existing_for_tracks,
+    existing_track_keys_cached,
+    resolve_playlist_dir,
     track_key,
 )
 from utils.loaders import load_primary_tracks, load_playlists, load_exportify_playlists
@@ -21,33 +25,155 @@ from downloader.youtube_link_downloader import download_from_link, download_from
 from menus.song_selection_menu import select_songs_for_playlist
 
 
-def _sanitize_playlist_name(name: str) -> str:
-    return (name or "").replace("/", "-").strip()
+# spotify_api modules are imported on first use (keeps startup light) and cached here,
+# together with the shared TokenManager instance under "_tm".
+_LAZY = {}
+
+
+def _lz(name: str):
+    m = _LAZY.get(name)
+    if m is None:
+        m = importlib.import_module(name)
+        _LAZY[name] = m
+    return m
+
+
+# (SpotifyClient, SpotifyDataLoader) per (client_id, redirect_uri), reused across menu actions
+# so the cached token survives between them. Cleared after auth changes.
+_client_cache = {}
+
+
+def _get_spotify(config: dict):
+    key = (config.get("spotify_client_id", ""), config.get("spotify_redirect_uri", ""))
+    ent = _client_cache.get(key)
+    if ent is None:
+        client = _lz("spotify_api.client").SpotifyClient(config, token_manager=_token_manager())
+        ent = (client, _lz("spotify_api.data_loader").SpotifyDataLoader(client))
+        _client_cache[key] = ent
+    return ent
+
+
+def _reset_spotify_clients() -> None:
+    """Drop cached clients and shared token refresh results after a login or logout."""
+    _client_cache.clear()
+    # Only if already imported; otherwise there is nothing shared to forget.
+    client_module = sys.modules.get("spotify_api.client")
+    if client_module is not None:
+        client_module.clear_refreshed_tokens()
+
+
+def _token_manager():
+    tm = _LAZY.get("_tm")
+    if tm is None:
+        tm = _lz("spotify_api.token_manager").TokenManager()
+        _LAZY["_tm"] = tm
+    return tm
+
+
+# Static menu entries, built once rather than on every redraw of the menu loops.
+_DOWNLOADS_CHOICES = [
+    "Download all pending (sequential) - Works with CSV and JSON sources",
+    "Download all pending (batch async) - Works with CSV and JSON sources",
+    "Search & Download a single track",
+    "Spotify Web API (OAuth) — Playlists / Liked Songs",
+    "Download from Exportify CSV folder",
+    "Download from playlists file (legacy Spotify export)",
+    "Download from YouTube link/playlist",
+    "Back",
+]
+
+_SPOTIFY_MENU_CHOICES = [
+    "Authenticate with Spotify (OAuth PKCE)",
+    "Download from my playlists",
+    "Download from liked songs",
+    "Spotify API credential setup help",
+    "Log out (clear cached token)",
+    "Back",
+]
+
+_DOWNLOAD_MODE_CHOICES = ["Download ALL pending playlists", "Pick which playlists to download"]
+
+# Checkbox entry listed first in playlist pickers; skips the per-playlist download confirmation.
+_AUTO_CONFIRM = "__auto_confirm__"
+_AUTO_CONFIRM_CHOICE = questionary.Choice(title="⚡ Download all selected without further confirmation", value=_AUTO_CONFIRM)
+
+
+def _split_auto_confirm(selected):
+    """Return (selected values without the auto-confirm entry, whether it was ticked)."""
+    selected = list(selected or [])
+    auto_confirm = _AUTO_CONFIRM in selected
+    return [v for v in selected if v != _AUTO_CONFIRM], auto_confirm
+
+
+def _confirm_playlist_download(playlist_name: str, count: int, auto_confirm: bool) -> bool:
+    if auto_confirm:
+        return True
+    return bool(
+        questionary.confirm(
+            f"Download {count} selected tracks into '{playlist_name}'?",
+            default=True,
+        ).ask()
+    )
+
+
+def _parse_max_int(value, default=None):
+    """Parse a positive integer limit from prompt input; blank, invalid or non-positive -> default."""
+    value = (value or "").strip()
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        log_warning(f"Ignoring invalid number: {value!r}")
+        return default
+    return parsed if parsed > 0 else default
 
 
 def _normalize_legacy_playlist_tracks(pl: dict) -> list:
     """Normalize legacy playlists.json playlist items into [{'artist','track'}, ...]."""
     tracks = []
-    for item in pl.get("items", []) or []:
-        t = item.get("track") if isinstance(item, dict) else None
+    append = tracks.append
+    for item in pl.get("items") or ():
+        # playlists.json is plain JSON, so an exact type check is enough here.
+        t = item.get("track") if type(item) is dict else None
         if not t:
             continue
-        artist = (t.get("artistName") or "").strip()
-        name = (t.get("trackName") or "").strip()
+        artist = t.get("artistName")
+        name = t.get("trackName")
         if artist and name:
-            tracks.append({"artist": artist, "track": name})
+            artist = artist.strip()
+            name = name.strip()
+            if artist and name:
+                append({"artist": artist, "track": name})
     return tracks
 
 
+async def _download_playlists(config: dict, queue: list) -> None:
+    """Download each queued (playlist_name, tracks) pair in order on a single event loop."""
+    for playlist_name, tracks in queue:
+        await download_playlist(
+            playlist_name,
+            tracks,
+            config["output_dir"],
+            config["audio_format"],
+            config["sleep_between"],
+        )
+
+
+def _run_playlist_downloads(config: dict, queue: list) -> None:
+    if queue:
+        asyncio.run(_download_playlists(config, queue))
+
+
 def _spotify_setup_help(config: dict) -> None:
     try:
-        from spotify_api.auth import check_spotify_credentials, spotify_app_setup_instructions
+        auth_mod = _lz("spotify_api.auth")
 
-        creds = check_spotify_credentials(config)
+        creds = auth_mod.check_spotify_credentials(config)
         log_info("\n" + "=" * 72)
         log_info("SPOTIFY WEB API SETUP")
         log_info("=" * 72)
-        log_info(spotify_app_setup_instructions(redirect_uri=creds.get("redirect_uri") or "http://localhost:8888/callback"))
+        log_info(auth_mod.spotify_app_setup_instructions(redirect_uri=creds.get("redirect_uri") or "http://localhost:8888/callback"))
         log_info("")
         log_info("Current config status:")
         log_info(f"- spotify_client_id: {('SET' if (config.get('spotify_client_id') or '').strip() else 'NOT SET (Exportify fallback will be used)')}")
@@ -63,17 +189,38 @@ def _spotify_setup_help(config: dict) -> None:
         log_error(f"Failed to show Spotify setup help: {e}")
 
 
+TOKEN_STATUS_TTL = 30
+
+# Last rendered status line, keyed by the token file's mtime; reset "mtime" to None to invalidate.
+_token_status_cache = {"mtime": None, "text": None, "ts": 0}
+
+
+def _invalidate_token_status() -> None:
+    _token_status_cache["mtime"] = None
+
+
 def _spotify_token_status(config: dict) -> str:
     try:
-        from spotify_api.token_manager import TokenManager
+        tm = _token_manager()
+        try:
+            mtime = os.stat(tm.cache_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+
+        cache = _token_status_cache
+        if cache["mtime"] == mtime and time.time() - cache["ts"] < TOKEN_STATUS_TTL:
+            return cache["text"]
 
-        tm = TokenManager()
         token = tm.load(config)
         if token is None:
-            return "No cached Spotify token found."
-        expired = tm.is_expired(token)
-        exp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(token.expires_at)))
-        return f"Token cached: YES | Expired: {'YES' if expired else 'NO'} | Expires at: {exp_str}"
+            text = "No cached Spotify token found."
+        else:
+            expired = tm.is_expired(token)
+            exp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(token.expires_at)))
+            text = f"Token cached: YES | Expired: {'YES' if expired else 'NO'} | Expires at: {exp_str}"
+
+        cache.update(mtime=mtime, text=text, ts=time.time())
+        return text
     except Exception as e:
         return f"Token status unavailable: {e}"
 
@@ -81,13 +228,9 @@ def _spotify_token_status(config: dict) -> str:
 def _spotify_authenticate(config: dict) -> None:
     """Run an interactive PKCE flow where the user pastes the redirect URL back into the CLI."""
     try:
-        from spotify_api.auth import (
-            SpotifyPKCEAuth,
-            check_spotify_credentials,
-            extract_code_from_redirect_url,
-        )
+        auth_mod = _lz("spotify_api.auth")
 
-        creds = check_spotify_credentials(config)
+        creds = auth_mod.check_spotify_credentials(config)
         if not creds.get("ok"):
             log_warning(creds.get("message") or "Spotify credentials are incomplete.")
             _spotify_setup_help(config)
@@ -96,7 +239,7 @@ def _spotify_authenticate(config: dict) -> None:
         if creds.get("client_id_source") == "exportify_fallback":
             log_warning("Using Exportify's public Spotify client id. This may stop working if Exportify rotates credentials.")
 
-        auth = SpotifyPKCEAuth(config)
+        auth = auth_mod.SpotifyPKCEAuth(config)
         flow = auth.begin_oauth_flow(show_dialog=True)
         auth_url = flow["auth_url"]
         pkce_pair = flow["pkce_pair"]
@@ -119,6 +262,7 @@ def _spotify_authenticate(config: dict) -> None:
         server = None
         server_thread = None
         callback_result = {"full_url": None, "error": None}
+        callback_done = threading.Event()
 
         parsed_redirect = urllib.parse.urlparse(redirect_uri) if redirect_uri else None
         can_listen = bool(
@@ -143,53 +287,56 @@ def _spotify_authenticate(config: dict) -> None:
 
             class _SpotifyCallbackHandler(BaseHTTPRequestHandler):
                 def do_GET(self):  # noqa: N802 (stdlib naming)
-                    try:
-                        path, _, query = self.path.partition("?")
-                        if path != expected_path:
-                            self.send_response(404)
-                            self.send_header("Content-Type", "text/plain; charset=utf-8")
-                            self.end_headers()
-                            self.wfile.write(b"Not Found")
-                            return
-
-                        # Reconstruct the full redirect URL so we can reuse existing parsing.
-                        if query:
-                            full = f"{redirect_uri}?{query}"
-                        else:
-                            full = redirect_uri
-
-                        callback_result["full_url"] = full
-
-                        self.send_response(200)
-                        self.send_header("Content-Type", "text/html; charset=utf-8")
+                    path, _, query = self.path.partition("?")
+                    if path != expected_path:
+                        self.send_response(404)
+                        self.send_header("Content-Type", "text/plain; charset=utf-8")
                         self.end_headers()
-                        self.wfile.write(
-                            (
-                                "<html><head><title>HARMONI</title></head><body>"
-                                "<h2>Spotify authentication received.</h2>"
-                                "<p>You can close this tab and return to the terminal.</p>"
-                                "</body></html>"
-                            ).encode("utf-8")
-                        )
-                    finally:
-                        # Shut down the server after the first request (in a separate thread).
-                        try:
-                            threading.Thread(target=self.server.shutdown, daemon=True).start()
-                        except Exception:
-                            pass
+                        self.wfile.write(b"Not Found")
+                        return
+
+                    # Reconstruct the full redirect URL so we can reuse existing parsing.
+                    if query:
+                        full = f"{redirect_uri}?{query}"
+                    else:
+                        full = redirect_uri
+
+                    callback_result["full_url"] = full
+                    callback_done.set()
+
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.end_headers()
+                    self.wfile.write(
+                        (
+                            "<html><head><title>HARMONI</title></head><body>"
+                            "<h2>Spotify authentication received.</h2>"
+                            "<p>You can close this tab and return to the terminal.</p>"
+                            "</body></html>"
+                        ).encode("utf-8")
+                    )
 
                 def log_message(self, format, *args):  # noqa: A003
                     # Silence default HTTP request logging.
                     return
 
             try:
-                server = HTTPServer((bind_host, port), _SpotifyCallbackHandler)
+                class _CallbackServer(ThreadingHTTPServer):
+                    allow_reuse_address = True
+                    daemon_threads = True
+                    # handle_request() returns after this long without a request,
+                    # so the serve loop notices callback_done being set.
+                    timeout = 1.0
+
+                server = _CallbackServer((bind_host, port), _SpotifyCallbackHandler)
 
                 def _serve_once() -> None:
                     try:
-                        server.serve_forever(poll_interval=0.1)
+                        while not callback_done.is_set():
+                            server.handle_request()
                     except Exception as e:
                         callback_result["error"] = str(e)
+                        callback_done.set()
 
                 server_thread = threading.Thread(target=_serve_once, daemon=True)
                 server_thread.start()
@@ -201,23 +348,27 @@ def _spotify_authenticate(config: dict) -> None:
                 server = None
 
         if questionary.confirm("Open the authorize URL in your default browser?", default=True).ask():
-            try:
-                webbrowser.open(auth_url)
-            except Exception:
-                pass
+            # Launching a browser can be slow; don't hold up waiting for the callback.
+            def _open_browser() -> None:
+                try:
+                    webbrowser.open(auth_url)
+                except Exception as e:
+                    log_warning(f"Could not open a browser: {e}")
+
+            threading.Thread(target=_open_browser, daemon=True).start()
 
         # If the callback server is running, wait for it to receive the redirect.
         pasted = ""
         if server is not None:
             log_info("Waiting for Spotify redirect to hit the local callback (timeout: 180 seconds)...")
-            start = time.time()
-            while time.time() - start < 180:
-                if callback_result.get("full_url"):
-                    pasted = str(callback_result["full_url"]).strip()
-                    break
-                if callback_result.get("error"):
-                    break
-                time.sleep(0.1)
+            if callback_done.wait(timeout=180):
+                pasted = str(callback_result.get("full_url") or "").strip()
+
+            # Stop the serve loop (also on timeout) and release the port.
+            callback_done.set()
+            if server_thread is not None:
+                server_thread.join(timeout=2.0)
+            server.server_close()
 
             if not pasted:
                 log_warning("Did not receive a callback within the timeout (or the callback server failed).")
@@ -236,7 +387,7 @@ def _spotify_authenticate(config: dict) -> None:
         code = ""
         parsed_state = ""
         if "http://" in pasted or "https://" in pasted:
-            parsed = extract_code_from_redirect_url(pasted)
+            parsed = auth_mod.extract_code_from_redirect_url(pasted)
             if parsed.get("error"):
                 log_error(f"Spotify returned an error: {parsed.get('error')}")
                 return
@@ -257,6 +408,8 @@ def _spotify_authenticate(config: dict) -> None:
 
         token = auth.exchange_code_for_token(code=code, code_verifier=pkce_pair.code_verifier)
         exp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(token.expires_at)))
+        _invalidate_token_status()
+        _reset_spotify_clients()
         log_info(f"✅ Spotify authentication successful. Token expires at: {exp_str}")
     except Exception as e:
         log_error(f"Spotify authentication failed: {e}")
@@ -264,10 +417,7 @@ def _spotify_authenticate(config: dict) -> None:
 
 def _spotify_download_from_playlists(config: dict) -> None:
     try:
-        from spotify_api.client import SpotifyClient
-        from spotify_api.data_loader import SpotifyDataLoader
-
-        client = SpotifyClient(config)
+        client, loader = _get_spotify(config)
 
         # Trigger token load/refresh early so we can provide a good message.
         try:
@@ -277,8 +427,6 @@ def _spotify_download_from_playlists(config: dict) -> None:
             log_info("Run 'Authenticate with Spotify' first.")
             return
 
-        loader = SpotifyDataLoader(client)
-
         try:
             me = client.me() or {}
             display = (me.get("display_name") or me.get("id") or "").strip()
@@ -311,10 +459,12 @@ def _spotify_download_from_playlists(config: dict) -> None:
             log_info("No usable playlists returned by Spotify.")
             return
 
-        selected_ids = questionary.checkbox(
-            "Select Spotify playlists to download (space toggles, enter confirms):",
-            choices=choices,
-        ).ask()
+        selected_ids, auto_confirm = _split_auto_confirm(
+            questionary.checkbox(
+                "Select Spotify playlists to download (space toggles, enter confirms):",
+                choices=[_AUTO_CONFIRM_CHOICE] + choices,
+            ).ask()
+        )
 
         if not selected_ids:
             log_warning("❌ No playlists selected.")
@@ -327,13 +477,14 @@ def _spotify_download_from_playlists(config: dict) -> None:
             return
 
         # Limit for safety; users can re-run if they want more.
-        max_tracks = questionary.text(
-            "Max tracks to load per playlist (blank = no limit; recommended: 300):",
-            default="300",
-        ).ask()
-        max_tracks = (max_tracks or "").strip()
-        max_tracks_int = int(max_tracks) if max_tracks.isdigit() else None
+        max_tracks_int = _parse_max_int(
+            questionary.text(
+                "Max tracks to load per playlist (blank = no limit; recommended: 300):",
+                default="300",
+            ).ask()
+        )
 
+        queue = []
         for pid in selected_ids:
             p = by_id.get(pid) or {}
             pl_name = (p.get("name") or "Spotify Playlist").strip()
@@ -348,9 +499,8 @@ def _spotify_download_from_playlists(config: dict) -> None:
                 log_warning(f"Playlist '{pl_name}' returned 0 tracks (or tracks were not usable).")
                 continue
 
-            playlist_dir = os.path.join(config["output_dir"], _sanitize_playlist_name(pl_name))
-            existing = existing_track_keys_in_dir(playlist_dir)
-            exists_count = sum(1 for t in tracks if track_key(t) in existing)
+            playlist_dir = resolve_playlist_dir(config["output_dir"], pl_name)
+            exists_count = count_existing_for_tracks(playlist_dir, {track_key(t) for t in tracks})
 
             log_info(f"Playlist: {pl_name}")
             log_info(f"  Total tracks loaded: {len(tracks)}")
@@ -366,23 +516,14 @@ def _spotify_download_from_playlists(config: dict) -> None:
                 log_info(f"❌ Skipped playlist: {pl_name}")
                 continue
 
-            confirm = questionary.confirm(
-                f"Download {len(selected_tracks)} selected tracks into '{pl_name}'?",
-                default=True,
-            ).ask()
-            if not confirm:
+            if not _confirm_playlist_download(pl_name, len(selected_tracks), auto_confirm):
                 log_info(f"❌ Skipped playlist: {pl_name}")
                 continue
 
-            asyncio.run(
-                download_playlist(
-                    pl_name,
-                    selected_tracks,
-                    config["output_dir"],
-                    config["audio_format"],
-                    config["sleep_between"],
-                )
-            )
+            queue.append((pl_name, selected_tracks))
+
+        # Selection is interactive, so downloads run afterwards on one event loop.
+        _run_playlist_downloads(config, queue)
 
     except Exception as e:
         log_error(f"Spotify playlist download failed: {e}")
@@ -390,10 +531,7 @@ def _spotify_download_from_playlists(config: dict) -> None:
 
 def _spotify_download_liked_songs(config: dict) -> None:
     try:
-        from spotify_api.client import SpotifyClient
-        from spotify_api.data_loader import SpotifyDataLoader
-
-        client = SpotifyClient(config)
+        client, loader = _get_spotify(config)
         try:
             _ = client.get_token()
         except Exception as e:
@@ -401,14 +539,12 @@ def _spotify_download_liked_songs(config: dict) -> None:
             log_info("Run 'Authenticate with Spotify' first.")
             return
 
-        loader = SpotifyDataLoader(client)
-
-        max_tracks = questionary.text(
-            "Max liked songs to load (blank = no limit; recommended: 500):",
-            default="500",
-        ).ask()
-        max_tracks = (max_tracks or "").strip()
-        max_tracks_int = int(max_tracks) if max_tracks.isdigit() else None
+        max_tracks_int = _parse_max_int(
+            questionary.text(
+                "Max liked songs to load (blank = no limit; recommended: 500):",
+                default="500",
+            ).ask()
+        )
 
         log_info("Loading liked songs from Spotify...")
         tracks = loader.load_liked_songs(max_tracks=max_tracks_int)
@@ -417,9 +553,8 @@ def _spotify_download_liked_songs(config: dict) -> None:
             return
 
         playlist_name = "Liked Songs"
-        playlist_dir = os.path.join(config["output_dir"], _sanitize_playlist_name(playlist_name))
-        existing = existing_track_keys_in_dir(playlist_dir)
-        exists_count = sum(1 for t in tracks if track_key(t) in existing)
+        playlist_dir = resolve_playlist_dir(config["output_dir"], playlist_name)
+        exists_count = count_existing_for_tracks(playlist_dir, {track_key(t) for t in tracks})
 
         log_info(f"Liked Songs")
         log_info(f"  Total tracks loaded: {len(tracks)}")
@@ -464,14 +599,7 @@ def _spotify_api_menu(config: dict) -> None:
 
         choice = questionary.select(
             "🎧 Spotify Web API — What would you like to do?",
-            choices=[
-                "Authenticate with Spotify (OAuth PKCE)",
-                "Download from my playlists",
-                "Download from liked songs",
-                "Spotify API credential setup help",
-                "Log out (clear cached token)",
-                "Back",
-            ],
+            choices=_SPOTIFY_MENU_CHOICES,
         ).ask()
 
         if choice == "Authenticate with Spotify (OAuth PKCE)":
@@ -488,9 +616,9 @@ def _spotify_api_menu(config: dict) -> None:
 
         elif choice == "Log out (clear cached token)":
             try:
-                from spotify_api.token_manager import TokenManager
-
-                ok = TokenManager().clear()
+                ok = _token_manager().clear()
+                _invalidate_token_status()
+                _reset_spotify_clients()
                 if ok:
                     log_info("✅ Cleared cached Spotify token.")
                 else:
@@ -508,16 +636,7 @@ def downloads_menu(config):
     while True:
         choice = questionary.select(
             "📥 Downloads Menu — What would you like to do?",
-            choices=[
-                "Download all pending (sequential) - Works with CSV and JSON sources",
-                "Download all pending (batch async) - Works with CSV and JSON sources",
-                "Search & Download a single track",
-                "Spotify Web API (OAuth) — Playlists / Liked Songs",
-                "Download from Exportify CSV folder",
-                "Download from playlists file (legacy Spotify export)",
-                "Download from YouTube link/playlist",
-                "Back",
-            ],
+            choices=_DOWNLOADS_CHOICES,
         ).ask()
 
         if choice == "Download all pending (sequential) - Works with CSV and JSON sources":
@@ -606,13 +725,10 @@ def downloads_menu(config):
 
             pending = []
             for pl in playlists:
-                playlist_dir = os.path.join(config["output_dir"], _sanitize_playlist_name(pl["name"]))
-                existing = existing_track_keys_in_dir(playlist_dir)
-                missing_count = 0
-                for t in pl["tracks"]:
-                    if track_key(t) not in existing:
-                        missing_count += 1
-                if missing_count > 0:
+                playlist_dir = resolve_playlist_dir(config["output_dir"], pl["name"])
+                existing = existing_track_keys_cached(playlist_dir)
+                # Stop at the first missing track; full counts are only needed for selected playlists.
+                if any(track_key(t) not in existing for t in pl["tracks"]):
                     pending.append(pl)
 
             if not pending:
@@ -621,20 +737,23 @@ def downloads_menu(config):
 
             sub_choice = questionary.select(
                 "Select download mode:",
-                choices=["Download ALL pending playlists", "Pick which playlists to download"],
+                choices=_DOWNLOAD_MODE_CHOICES,
             ).ask()
 
             to_download = pending if sub_choice == "Download ALL pending playlists" else []
+            auto_confirm = sub_choice == "Download ALL pending playlists"
 
             if sub_choice == "Pick which playlists to download":
                 choices = [
                     questionary.Choice(title=f"{pl['name']} ({len(pl['tracks'])} tracks)", value=pl["name"])
                     for pl in pending
                 ]
-                selected_names = questionary.checkbox(
-                    "Select playlists to download (space to toggle, enter to confirm):",
-                    choices=choices,
-                ).ask()
+                selected_names, auto_confirm = _split_auto_confirm(
+                    questionary.checkbox(
+                        "Select playlists to download (space to toggle, enter to confirm):",
+                        choices=[_AUTO_CONFIRM_CHOICE] + choices,
+                    ).ask()
+                )
 
                 if not selected_names:
                     log_warning("❌ No playlists selected.")
@@ -646,12 +765,13 @@ def downloads_menu(config):
                     log_info("")
                     continue
 
-                to_download = [pl for pl in pending if pl["name"] in selected_names]
+                selected_set = set(selected_names)
+                to_download = [pl for pl in pending if pl["name"] in selected_set]
 
+            queue = []
             for playlist in to_download:
-                playlist_dir = os.path.join(config["output_dir"], _sanitize_playlist_name(playlist["name"]))
-                existing = existing_track_keys_in_dir(playlist_dir)
-                exists_count = sum(1 for t in playlist["tracks"] if track_key(t) in existing)
+                playlist_dir = resolve_playlist_dir(config["output_dir"], playlist["name"])
+                exists_count = count_existing_for_tracks(playlist_dir, {track_key(t) for t in playlist["tracks"]})
 
                 log_info(f"Playlist: {playlist['name']}")
                 log_info(f"  Total tracks: {len(playlist['tracks'])}")
@@ -667,23 +787,13 @@ def downloads_menu(config):
                     log_info(f"❌ Skipped playlist: {playlist['name']}")
                     continue
 
-                confirm = questionary.confirm(
-                    f"Download {len(selected_tracks)} selected tracks into '{playlist['name']}'?",
-                    default=True,
-                ).ask()
-                if not confirm:
+                if not _confirm_playlist_download(playlist["name"], len(selected_tracks), auto_confirm):
                     log_info(f"❌ Skipped playlist: {playlist['name']}")
                     continue
 
-                asyncio.run(
-                    download_playlist(
-                        playlist["name"],
-                        selected_tracks,
-                        config["output_dir"],
-                        config["audio_format"],
-                        config["sleep_between"],
-                    )
-                )
+                queue.append((playlist["name"], selected_tracks))
+
+            _run_playlist_downloads(config, queue)
 
         elif choice == "Download from Exportify CSV folder":
             exportify_dir = config.get("exportify_watch_folder", "data/exportify")
@@ -693,14 +803,22 @@ def downloads_menu(config):
                 log_info("No CSV playlists found in exportify folder.")
                 continue
 
+            # First playlist wins on duplicate names, as the previous linear lookup did.
+            by_name = {}
+            for pl in playlists:
+                by_name.setdefault(pl["name"], pl)
+
             choices = [
                 questionary.Choice(title=f"{pl['name']} ({len(pl['tracks'])} tracks)", value=pl["name"])
                 for pl in playlists
             ]
-            selected_names = questionary.checkbox(
-                "Select playlists to download (space to toggle, enter to confirm):",
-                choices=choices,
-            ).ask()
+            choices.insert(0, _AUTO_CONFIRM_CHOICE)
+            selected_names, auto_confirm = _split_auto_confirm(
+                questionary.checkbox(
+                    "Select playlists to download (space to toggle, enter to confirm):",
+                    choices=choices,
+                ).ask()
+            )
 
             if not selected_names:
                 log_warning("❌ No playlists selected.")
@@ -718,10 +836,12 @@ def downloads_menu(config):
                 ).ask()
 
                 if retry == "Try selecting playlists again":
-                    selected_names = questionary.checkbox(
-                        "Select playlists to download (space to toggle, enter to confirm):",
-                        choices=choices,
-                    ).ask()
+                    selected_names, auto_confirm = _split_auto_confirm(
+                        questionary.checkbox(
+                            "Select playlists to download (space to toggle, enter to confirm):",
+                            choices=choices,
+                        ).ask()
+                    )
 
                     if not selected_names:
                         log_info("No playlists selected. Returning to Downloads menu.")
@@ -729,12 +849,12 @@ def downloads_menu(config):
                 else:
                     continue
 
+            queue = []
             for name in selected_names:
-                playlist = next(pl for pl in playlists if pl["name"] == name)
+                playlist = by_name[name]
 
-                playlist_dir = os.path.join(config["output_dir"], _sanitize_playlist_name(playlist["name"]))
-                existing = existing_track_keys_in_dir(playlist_dir)
-                exists_count = sum(1 for t in playlist["tracks"] if track_key(t) in existing)
+                playlist_dir = resolve_playlist_dir(config["output_dir"], playlist["name"])
+                exists_count = count_existing_for_tracks(playlist_dir, {track_key(t) for t in playlist["tracks"]})
 
                 log_info(f"Playlist: {playlist['name']}")
                 log_info(f"  Total tracks: {len(playlist['tracks'])}")
@@ -750,24 +870,13 @@ def downloads_menu(config):
                     log_info(f"❌ Skipped playlist: {playlist['name']}")
                     continue
 
-                confirm = questionary.confirm(
-                    f"Download {len(selected_tracks)} selected tracks into '{playlist['name']}'?",
-                    default=True,
-                ).ask()
-
-                if not confirm:
+                if not _confirm_playlist_download(playlist["name"], len(selected_tracks), auto_confirm):
                     log_info(f"❌ Skipped playlist: {playlist['name']}")
                     continue
 
-                asyncio.run(
-                    download_playlist(
-                        playlist["name"],
-                        selected_tracks,
-                        config["output_dir"],
-                        config["audio_format"],
-                        config["sleep_between"],
-                    )
-                )
+                queue.append((playlist["name"], selected_tracks))
+
+            _run_playlist_downloads(config, queue)
 
         elif choice == "Download from YouTube link/playlist":
             url = questionary.text("Paste YouTube video or playlist URL:").ask()
@@ -1,7 +1,7 @@
 import questionary
 
 from utils.logger import log_info, log_warning
-from utils.track_checker import existing_track_keys_in_dir, track_key
+from utils.track_checker import existing_track_keys_cached, track_key
 
 
 def select_songs_for_playlist(playlist_name: str, tracks: list, playlist_dir: str) -> list:
@@ -30,7 +30,7 @@ def select_songs_for_playlist(playlist_name: str, tracks: list, playlist_dir: st
         log_warning(f"Playlist '{playlist_name}' has no valid tracks.")
         return []
 
-    existing_keys = existing_track_keys_in_dir(playlist_dir)
+    existing_keys = existing_track_keys_cached(playlist_dir)
 
     # Maintain a working set of selected song keys.
     selected_keys = {
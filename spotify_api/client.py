@@ -1,25 +1,196 @@
+import email.utils
+import hashlib
 import json
+import random
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Any, Dict, List, Optional
-
-from .auth import SpotifyPKCEAuth
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+from .auth import SpotifyPKCEAuth, get_effective_spotify_client_id
+from .http_cache import DiskCache
 from .token_manager import TokenInfo, TokenManager
 from utils.logger import log_warning
 
 
 SPOTIFY_API_BASE_URL = "https://api.spotify.com/v1"
 
+# At most one /api/token refresh in flight per refresh token; concurrent callers wait and share it.
+# _refreshed keeps the latest result so late callers holding a stale token reuse it (double-check).
+# Keyed by the stale token's refresh_token, so a result is only ever shared within one login.
+_refresh_lock = threading.Lock()
+_refresh_inflight: Dict[str, Dict[str, Any]] = {}
+_refreshed: Dict[str, TokenInfo] = {}
+
+
+def clear_refreshed_tokens() -> None:
+    """Forget shared refresh results (call on logout or when the account changes)."""
+    with _refresh_lock:
+        _refreshed.clear()
+
+
+# Proactive pacing so bursts (e.g. concurrent paging) stay under Spotify's rolling limits;
+# 429 handling remains as the safety net.
+DEFAULT_SPOTIFY_RPS = 20
+DEFAULT_SPOTIFY_MAX_CONCURRENCY = 10
+SPOTIFY_WINDOW_REQUESTS = 100
+SPOTIFY_WINDOW_SECONDS = 30.0
+# After a 429, buckets refill at half speed for at least this long.
+RATE_LIMIT_PENALTY_SECONDS = 30.0
+
+# `fields=` projection for /playlists/{id}/tracks: only what SpotifyDataLoader._normalize_track
+# and the paging code read, instead of full track objects (available_markets, images, ...).
+PLAYLIST_ITEM_FIELDS = (
+    "items(added_at,track(id,uri,name,is_local,duration_ms,explicit,popularity,"
+    "album(name,release_date),artists(name),external_ids(isrc),external_urls(spotify))),"
+    "total,limit,offset"
+)
+
+
+def _json_loads(body: bytes) -> Any:
+    """Parse a response body straight from bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per `period` seconds (burst = rate)."""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = max(1.0, float(rate))
+        self._refill_per_sec = self.capacity / float(period)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._slow_until = 0.0
+        self._lock = threading.Lock()
+
+    def penalize(self, seconds: float) -> None:
+        """Halve the refill rate for the next `seconds` (multiplicative decrease after a 429)."""
+        with self._lock:
+            self._tokens = 0.0
+            self._slow_until = max(self._slow_until, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                rate = self._refill_per_sec / 2 if now < self._slow_until else self._refill_per_sec
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / rate
+            time.sleep(wait)
+
+
+def _etag_cacheable(path: str) -> bool:
+    """Endpoints re-read on every menu visit, whose responses are cached and revalidated via ETag."""
+    return path == "/me/playlists" or (path.startswith("/playlists/") and path.endswith("/tracks"))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse Retry-After as delta-seconds or an HTTP-date (RFC 7231); None if absent/invalid."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], Dict[str, Any]],
+    *,
+    limit: int,
+    offset: int = 0,
+    max_workers: int = 1,
+    max_items: Optional[int] = None,
+    page_key: str = "items",
+) -> Iterator[Dict[str, Any]]:
+    """Yield the pages of an endpoint that returns {items, total, limit, offset}, in order.
+
+    fetch_page(limit, offset) requests one page. The first page tells us `total`; the
+    remaining offsets are then requested up to max_workers at a time. max_items is how many
+    items the caller expects to read, so a capped caller never fetches pages past it
+    (further pages still follow, one at a time, if the caller keeps iterating).
+    """
+
+    first = fetch_page(limit, offset)
+    yield first
+
+    items = first.get(page_key) or []
+    total = first.get("total")
+    if total is None or not items:
+        return
+
+    page_size = int(first.get("limit") or limit)
+    offsets = list(range(offset + page_size, int(total), page_size))
+    if not offsets:
+        return
+
+    def fetch(page_offset: int) -> Dict[str, Any]:
+        return fetch_page(limit, page_offset)
+
+    wanted = None if max_items is None else int(max_items) - len(items)
+    workers = max(1, min(int(max_workers), len(offsets)))
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        start = 0
+        while start < len(offsets):
+            # Uncapped callers get every remaining page queued at once; capped ones only
+            # the pages their remaining quota can still fill.
+            window = len(offsets)
+            if wanted is not None:
+                window = max(1, min(workers, -(-wanted // page_size)))
+            batch = offsets[start : start + window]
+            start += len(batch)
+            pages = executor.map(fetch, batch) if executor is not None else map(fetch, batch)
+            for page in pages:
+                yield page
+                items = page.get(page_key) or []
+                if not items:
+                    return
+                if wanted is not None:
+                    wanted -= len(items)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
 
 class SpotifyClient:
-    """Thin Spotify Web API client (stdlib-only).
+    """Thin Spotify Web API client.
 
     This client expects an OAuth access token (Authorization Code w/ PKCE).
+    Requests go through a pooled httpx.Client when httpx is installed and fall
+    back to urllib otherwise.
 
     Design goals:
-    - Centralize retry + rate limiting (429 Retry-After)
+    - Centralize retry + rate limiting (token buckets up front, 429 Retry-After as fallback)
+    - Reuse keep-alive connections and cap concurrent requests (spotify_max_concurrency)
     - Provide high-level helpers that return *fully paged* lists
     """
 
@@ -27,6 +198,30 @@ class SpotifyClient:
         self.config = config or {}
         self.token_manager = token_manager or TokenManager()
         self._token: Optional[TokenInfo] = None
+        # Authorization header for self._token, valid until the monotonic deadline _exp_mono.
+        self._auth_header: Optional[str] = None
+        self._auth_token: Optional[TokenInfo] = None
+        self._exp_mono = 0.0
+        # One keep-alive connection pool per client. The semaphore caps API calls and token
+        # refreshes in flight and matches the pool size, so requests never queue for a connection.
+        self._max_concurrency = max(1, int(self.config.get("spotify_max_concurrency", DEFAULT_SPOTIFY_MAX_CONCURRENCY)))
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(self._max_concurrency)
+        self._rate_buckets = (
+            _TokenBucket(float(self.config.get("spotify_rps", DEFAULT_SPOTIFY_RPS)), 1.0),
+            _TokenBucket(SPOTIFY_WINDOW_REQUESTS, SPOTIFY_WINDOW_SECONDS),
+        )
+        # On-disk ETag cache for playlist listings and playlist tracks (spotify_http_cache).
+        self._http_cache = DiskCache() if bool(self.config.get("spotify_http_cache", True)) else None
+        # Hashed account id the cache entries are keyed by; see _cache_owner().
+        self._cache_owner_id: Optional[str] = None
+        self._cache_owner_lock = threading.Lock()
+
+    @property
+    def max_concurrency(self) -> int:
+        """How many API calls this client runs at once (spotify_max_concurrency)."""
+        return self._max_concurrency
 
     # -----------------
     # Token management
@@ -34,6 +229,7 @@ class SpotifyClient:
 
     def set_token(self, token: TokenInfo) -> None:
         self._token = token
+        self._cache_owner_id = None
         self.token_manager.save(self.config, token)
 
     def get_token(self) -> TokenInfo:
@@ -52,20 +248,166 @@ class SpotifyClient:
         if not self._token.refresh_token:
             raise RuntimeError("Spotify token expired and no refresh_token is available.")
 
-        auth = SpotifyPKCEAuth(self.config, token_manager=self.token_manager)
-        refreshed = auth.refresh_access_token(refresh_token=self._token.refresh_token)
-        self._token = refreshed
-        return refreshed
+        return self._refresh_token(self._token)
+
+    def _refresh_token(self, stale: TokenInfo) -> TokenInfo:
+        """Replace `stale` with a fresh access token.
+
+        Joins a refresh already running for the same refresh token, and skips the request
+        entirely if another caller refreshed since `stale` was issued.
+        """
+        key = stale.refresh_token or ""
+        with _refresh_lock:
+            latest = _refreshed.get(key)
+            if (
+                latest is not None
+                and latest.access_token != stale.access_token
+                and not self.token_manager.is_expired(latest)
+            ):
+                self._token = latest
+                return latest
+
+            call = _refresh_inflight.get(key)
+            owner = call is None
+            if owner:
+                call = {"done": threading.Event(), "token": None, "error": None}
+                _refresh_inflight[key] = call
+
+        if not owner:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise RuntimeError(f"Spotify token refresh failed: {call['error']}")
+            self._token = call["token"]
+            return call["token"]
+
+        try:
+            auth = SpotifyPKCEAuth(self.config, token_manager=self.token_manager)
+            with self._semaphore:
+                refreshed = auth.refresh_access_token(refresh_token=stale.refresh_token)
+            call["token"] = refreshed
+            self._token = refreshed
+            return refreshed
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with _refresh_lock:
+                _refresh_inflight.pop(key, None)
+                if call["token"] is not None:
+                    _refreshed[key] = call["token"]
+            call["done"].set()
 
     # -----------------
     # HTTP helpers
     # -----------------
 
+    def _authorization(self) -> str:
+        """Return the cached Authorization header, going through get_token() only when it may be stale."""
+        if self._auth_token is None or self._auth_token is not self._token or time.monotonic() >= self._exp_mono:
+            token = self.get_token()
+            self._auth_header = f"{token.token_type} {token.access_token}"
+            # Same 60 s skew as TokenManager.is_expired, so get_token() refreshes right on time.
+            self._exp_mono = time.monotonic() + (float(token.expires_at) - time.time()) - 60.0
+            self._auth_token = token
+        return self._auth_header
+
+    def _cache_owner(self) -> Optional[str]:
+        """Opaque id of the logged-in account for the ETag cache, or None if it is unknown.
+
+        Hashes the client id with the Spotify user id, so entries survive token refreshes
+        (PKCE rotates the refresh token on each one) and no account id is stored. The user id
+        comes from /me, fetched once per login (set_token starts a new one).
+        """
+        with self._cache_owner_lock:
+            if self._cache_owner_id is None:
+                try:
+                    user_id = str(self.me().get("id") or "")
+                except Exception:
+                    user_id = ""
+                if not user_id:
+                    return None
+                key = f"{get_effective_spotify_client_id(self.config)}:{user_id}"
+                self._cache_owner_id = hashlib.sha256(key.encode("utf-8")).hexdigest()
+            return self._cache_owner_id
+
+    def _get_http(self):
+        """Lazily create the pooled httpx.Client (None when httpx is not installed)."""
+        if httpx is None:
+            return None
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(
+                        timeout=30.0,
+                        limits=httpx.Limits(
+                            max_connections=self._max_concurrency,
+                            max_keepalive_connections=self._max_concurrency,
+                        ),
+                    )
+        return self._http
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._http_cache is not None:
+            self._http_cache.close()
+
+    def _send(self, method: str, url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request and return (status, headers, body); HTTP errors are returned, not raised."""
+        http = self._get_http()
+        if http is not None:
+            resp = http.request(method, url, headers=headers)
+            return resp.status_code, dict(resp.headers), resp.content
+
+        req = urllib.request.Request(url=url, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                return getattr(resp, "status", 200), dict(resp.headers), resp.read()
+        except urllib.error.HTTPError as e:
+            body = e.read() if hasattr(e, "read") else b""
+            return e.code, dict(getattr(e, "headers", {}) or {}), body
+
     def _sleep_with_jitter(self, seconds: float) -> None:
-        # Avoid synchronized retries when running concurrent calls.
+        """Sleep for a server-given delay plus a small random extra, so concurrent retries spread out."""
         seconds = float(max(0.0, seconds))
         jitter = float(self.config.get("spotify_retry_jitter", 0.25))
-        time.sleep(seconds + (jitter * (time.time() % 1.0)))
+        time.sleep(seconds + random.uniform(0.0, jitter))
+
+    @staticmethod
+    def _sleep_backoff(attempt: int, base: float, cap: float) -> None:
+        """Exponential backoff with jitter: a random delay between base and min(cap, base * 2**attempt)."""
+        upper = min(cap, base * (2 ** max(0, attempt)))
+        time.sleep(random.uniform(min(base, upper), upper))
+
+    def _log_auth_failure(self, status: int, endpoint: str, headers: Dict[str, str], body: bytes, text: str) -> None:
+        """Log actionable diagnostics for a 401/403 that is about to be raised (no secrets)."""
+        lines = ["Spotify API auth failure diagnostics:", f"- HTTP status: {status}", f"- Endpoint: {endpoint}"]
+
+        www_auth = headers.get("WWW-Authenticate") or headers.get("www-authenticate")
+        if www_auth:
+            lines.append(f"- WWW-Authenticate: {www_auth}")
+
+        try:
+            payload = _json_loads(body) if body else {}
+            err = payload.get("error") if isinstance(payload, dict) else None
+            if isinstance(err, dict) and err.get("message"):
+                lines.append(f"- Error message: {err.get('message')}")
+        except Exception:
+            pass
+
+        token_scope = getattr(self._token, "scope", None)
+        lines.append(f"- Token scope: {token_scope}" if self._token else "- Token scope: <no token loaded>")
+
+        desired_scopes = [str(s).strip() for s in (self.config.get("spotify_scopes") or []) if str(s).strip()]
+        lines.append(f"- Config spotify_scopes: {desired_scopes}")
+        missing_scopes = sorted(set(desired_scopes).difference(str(token_scope or "").split()))
+        if missing_scopes:
+            lines.append(f"- Missing scopes vs config: {missing_scopes}")
+
+        if text:
+            lines.append(f"- Raw body: {text}")
+        log_warning("\n".join(lines))
 
     def request_json(
         self,
@@ -91,137 +433,138 @@ class SpotifyClient:
         attempt = 0
         while True:
             attempt += 1
-            token = self.get_token()
+            authorization = self._authorization()
 
             url = f"{SPOTIFY_API_BASE_URL}{path}"
             if params:
                 url = f"{url}?{urllib.parse.urlencode({k: str(v) for k, v in params.items() if v is not None})}"
 
-            req = urllib.request.Request(
-                url=url,
-                method=method.upper(),
-                headers={
-                    "Authorization": f"{token.token_type} {token.access_token}",
-                    "Accept": "application/json",
-                },
-            )
+            request_headers = {
+                "Authorization": authorization,
+                "Accept": "application/json",
+            }
+
+            # Revalidate cached playlist responses; an unchanged one comes back as a bodiless 304.
+            cache = self._http_cache if method.upper() == "GET" and _etag_cacheable(path) else None
+            cached = None
+            owner = self._cache_owner() if cache is not None else None
+            if owner is None:
+                cache = None
+            else:
+                try:
+                    cached = cache.get(owner, url)
+                except Exception:
+                    cached = None
+                if cached:
+                    request_headers["If-None-Match"] = cached[0]
+
+            for bucket in self._rate_buckets:
+                bucket.acquire()
 
             try:
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    body = resp.read().decode("utf-8")
-                    status = getattr(resp, "status", 200)
-                    headers = dict(resp.headers)
-            except urllib.error.HTTPError as e:
-                status = e.code
-                headers = dict(getattr(e, "headers", {}) or {})
-                body = (e.read().decode("utf-8") if hasattr(e, "read") else "")
-
-                # --- Diagnostics for common auth issues (401/403) ---
-                if status in (401, 403):
-                    www_auth = headers.get("WWW-Authenticate") or headers.get("www-authenticate")
-                    msg = None
-                    try:
-                        payload = json.loads(body) if body else {}
-                        if isinstance(payload, dict):
-                            err = payload.get("error")
-                            if isinstance(err, dict):
-                                msg = err.get("message")
-                    except Exception:
-                        msg = None
-
-                    desired_scopes = [str(s).strip() for s in (self.config.get("spotify_scopes") or []) if str(s).strip()]
-                    token_scopes = [s for s in str(getattr(self._token, "scope", "") or "").split() if s]
-                    missing_scopes = sorted(set(desired_scopes) - set(token_scopes))
-
-                    # Keep logs actionable and avoid leaking secrets.
-                    log_warning(
-                        "Spotify API auth failure diagnostics:\n"
-                        f"- HTTP status: {status}\n"
-                        f"- Endpoint: {method.upper()} {path}\n"
-                        + (f"- WWW-Authenticate: {www_auth}\n" if www_auth else "")
-                        + (f"- Error message: {msg}\n" if msg else "")
-                        + (f"- Token scope: {getattr(self._token, 'scope', None)}\n" if self._token else "- Token scope: <no token loaded>\n")
-                        + (f"- Config spotify_scopes: {desired_scopes}\n" if desired_scopes else "- Config spotify_scopes: []\n")
-                        + (f"- Missing scopes vs config: {missing_scopes}\n" if missing_scopes else "")
-                        + (f"- Raw body: {body}" if body else "")
-                    )
+                with self._semaphore:
+                    status, headers, body = self._send(method.upper(), url, request_headers)
+            except Exception as e:
+                if attempt <= max_retries:
+                    self._sleep_backoff(attempt, backoff_base, 30.0)
+                    continue
+                raise RuntimeError(f"Spotify API request failed: {e}") from e
+
+            if status >= 400:
+                # Error bodies are small; decode them once for messages and logs.
+                text = body.decode("utf-8", "replace")
 
                 # 401: token invalid/expired (server-side); try refresh once.
                 if status == 401 and retry_401_refresh and attempt <= max_retries:
-                    if self._token and self._token.refresh_token and bool(self.config.get("spotify_auto_refresh", True)):
+                    stale = self._auth_token or self._token
+                    if stale and stale.refresh_token and bool(self.config.get("spotify_auto_refresh", True)):
                         try:
-                            auth = SpotifyPKCEAuth(self.config, token_manager=self.token_manager)
-                            refreshed = auth.refresh_access_token(refresh_token=self._token.refresh_token)
-                            self._token = refreshed
+                            self._refresh_token(stale)
                             retry_401_refresh = False
                             continue
                         except Exception:
                             # fall through to raise
                             pass
 
+                # Diagnostics only once the auth failure is final, not for 401s fixed by a refresh.
+                if status in (401, 403):
+                    self._log_auth_failure(status, f"{method.upper()} {path}", headers, body, text)
+
                 # 429: rate limited.
                 if status == 429 and retry_429 and attempt <= max_retries:
-                    retry_after = headers.get("Retry-After")
-                    try:
-                        delay = float(retry_after) if retry_after is not None else 1.0
-                    except Exception:
-                        delay = 1.0
+                    delay = _parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+                    delay = 1.0 if delay is None else delay
+                    for bucket in self._rate_buckets:
+                        bucket.penalize(max(RATE_LIMIT_PENALTY_SECONDS, delay))
                     self._sleep_with_jitter(max(1.0, delay))
                     continue
 
                 # 5xx: transient errors.
                 if status >= 500 and retry_5xx and attempt <= max_retries:
-                    delay = backoff_base * (2 ** max(0, attempt - 1))
-                    self._sleep_with_jitter(min(60.0, delay))
+                    self._sleep_backoff(attempt, backoff_base, 60.0)
                     continue
 
                 # Prefer the server-provided message when available.
-                detail = body
+                detail = text
                 try:
-                    payload = json.loads(body) if body else {}
+                    payload = _json_loads(body) if body else {}
                     if isinstance(payload, dict) and isinstance(payload.get("error"), dict) and payload["error"].get("message"):
                         detail = str(payload["error"].get("message"))
                 except Exception:
                     pass
 
-                raise RuntimeError(f"Spotify API error {status}: {detail}") from e
-            except Exception as e:
-                if attempt <= max_retries:
-                    delay = backoff_base * (2 ** max(0, attempt - 1))
-                    self._sleep_with_jitter(min(30.0, delay))
-                    continue
-                raise RuntimeError(f"Spotify API request failed: {e}") from e
+                raise RuntimeError(f"Spotify API error {status}: {detail}")
+
+            if status == 304 and cached:
+                try:
+                    cache.touch(owner, url)
+                except Exception:
+                    pass
+                return _json_loads(cached[1])
 
             if not body:
                 return {}
 
             try:
-                return json.loads(body)
+                data = _json_loads(body)
             except Exception as e:
-                raise RuntimeError(f"Spotify API response was not JSON (status {status}): {body}") from e
+                raise RuntimeError(
+                    f"Spotify API response was not JSON (status {status}): {body.decode('utf-8', 'replace')}"
+                ) from e
 
-    def _paginate(self, path: str, *, params: Optional[Dict[str, Any]] = None, page_key: str = "items") -> List[Dict[str, Any]]:
-        """Fetch all pages for an endpoint that returns {items, total, limit, offset}."""
+            etag = headers.get("ETag") or headers.get("etag")
+            if cache is not None and etag:
+                try:
+                    cache.put(owner, url, etag, body)
+                except Exception:
+                    # The cache is best effort; a locked or unwritable database must not fail the request.
+                    pass
+            return data
 
-        out: List[Dict[str, Any]] = []
-        limit = int((params or {}).get("limit") or 50)
-        offset = int((params or {}).get("offset") or 0)
+    def _paginate(self, path: str, *, params: Optional[Dict[str, Any]] = None, page_key: str = "items") -> List[Dict[str, Any]]:
+        """Fetch all pages for an endpoint that returns {items, total, limit, offset}.
 
-        while True:
-            page = self.request_json("GET", path, params={**(params or {}), "limit": limit, "offset": offset})
-            items = page.get(page_key) or []
-            if isinstance(items, list):
-                out.extend([x for x in items if isinstance(x, dict)])
+        Pages after the first are requested concurrently (bounded by spotify_max_concurrency)
+        and stitched back in order; see iter_pages().
+        """
 
-            total = page.get("total")
-            if total is None:
-                break
+        params = params or {}
 
-            got = len(items) if isinstance(items, list) else 0
-            offset += got
-            if got <= 0 or offset >= int(total):
-                break
+        def fetch(limit: int, offset: int) -> Dict[str, Any]:
+            return self.request_json("GET", path, params={**params, "limit": limit, "offset": offset})
 
+        out: List[Dict[str, Any]] = []
+        pages = iter_pages(
+            fetch,
+            limit=int(params.get("limit") or 50),
+            offset=int(params.get("offset") or 0),
+            max_workers=self._max_concurrency,
+            page_key=page_key,
+        )
+        for page in pages:
+            items = page.get(page_key) or []
+            if isinstance(items, list):
+                out.extend(x for x in items if isinstance(x, dict))
         return out
 
     # -----------------
@@ -234,11 +577,14 @@ class SpotifyClient:
     def current_user_playlists(self, *, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
         return self.request_json("GET", "/me/playlists", params={"limit": limit, "offset": offset})
 
-    def playlist_items(self, playlist_id: str, *, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+    def playlist_items(
+        self, playlist_id: str, *, limit: int = 100, offset: int = 0, fields: Optional[str] = PLAYLIST_ITEM_FIELDS
+    ) -> Dict[str, Any]:
+        # fields=None requests the full, unprojected track objects.
         return self.request_json(
             "GET",
             f"/playlists/{playlist_id}/tracks",
-            params={"limit": limit, "offset": offset, "additional_types": "track"},
+            params={"limit": limit, "offset": offset, "additional_types": "track", "fields": fields},
         )
 
     def current_user_saved_tracks(self, *, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
@@ -251,14 +597,50 @@ class SpotifyClient:
     def get_user_playlists(self, *, limit: int = 50) -> List[Dict[str, Any]]:
         return self._paginate("/me/playlists", params={"limit": min(50, int(limit))}, page_key="items")
 
-    def get_playlist_tracks(self, playlist_id: str, *, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_playlist_tracks(
+        self, playlist_id: str, *, limit: int = 100, fields: Optional[str] = PLAYLIST_ITEM_FIELDS
+    ) -> List[Dict[str, Any]]:
         # Endpoint shape: {items: [{added_at, track: {...}}], total, ...}
         return self._paginate(
             f"/playlists/{playlist_id}/tracks",
-            params={"limit": min(100, int(limit)), "additional_types": "track"},
+            params={"limit": min(100, int(limit)), "additional_types": "track", "fields": fields},
             page_key="items",
         )
 
     def get_liked_songs(self, *, limit: int = 50) -> List[Dict[str, Any]]:
         # Endpoint shape: {items: [{added_at, track: {...}}], total, ...}
         return self._paginate("/me/tracks", params={"limit": min(50, int(limit))}, page_key="items")
+
+    # -----------------
+    # Batched lookups ("get several" endpoints)
+    # -----------------
+
+    def _get_several(self, path: str, key: str, ids: List[str], batch_size: int) -> List[Dict[str, Any]]:
+        """Look up ids in batches of batch_size per request (requests run concurrently), keeping input order.
+
+        Unknown ids come back as null from Spotify and are dropped.
+        """
+        ids = [i for i in ids if i]
+        batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+        if not batches:
+            return []
+
+        def fetch(batch: List[str]) -> List[Dict[str, Any]]:
+            page = self.request_json("GET", path, params={"ids": ",".join(batch)})
+            return [x for x in (page.get(key) or []) if isinstance(x, dict)]
+
+        out: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=min(len(batches), self._max_concurrency)) as executor:
+            for items in executor.map(fetch, batches):
+                out.extend(items)
+        return out
+
+    def get_tracks(self, ids: List[str]) -> List[Dict[str, Any]]:
+        return self._get_several("/tracks", "tracks", ids, 50)
+
+    def get_albums(self, ids: List[str]) -> List[Dict[str, Any]]:
+        # /albums accepts at most 20 ids per request.
+        return self._get_several("/albums", "albums", ids, 20)
+
+    def get_artists(self, ids: List[str]) -> List[Dict[str, Any]]:
+        return self._get_several("/artists", "artists", ids, 50)
@@ -1,6 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from .client import SpotifyClient
+from .client import SpotifyClient, iter_pages
 
 
 class SpotifyDataLoader:
@@ -19,15 +19,17 @@ class SpotifyDataLoader:
 
     def list_all_playlists(self, *, limit: int = 50, max_playlists: Optional[int] = None) -> List[Dict[str, Any]]:
         playlists: List[Dict[str, Any]] = []
-        offset = 0
-
-        while True:
-            if max_playlists is not None and len(playlists) >= int(max_playlists):
-                break
-
-            page = self.client.current_user_playlists(limit=limit, offset=offset)
-            items = page.get("items") or []
-            for p in items:
+        if max_playlists is not None and int(max_playlists) <= 0:
+            return playlists
+
+        pages = iter_pages(
+            lambda limit, offset: self.client.current_user_playlists(limit=limit, offset=offset),
+            limit=limit,
+            max_workers=self._max_workers(),
+            max_items=max_playlists,
+        )
+        for page in pages:
+            for p in page.get("items") or []:
                 if not isinstance(p, dict):
                     continue
                 playlists.append(
@@ -41,18 +43,7 @@ class SpotifyDataLoader:
                 )
 
                 if max_playlists is not None and len(playlists) >= int(max_playlists):
-                    break
-
-            total = page.get("total")
-            if total is None:
-                break
-
-            offset += len(items)
-            if offset >= int(total):
-                break
-
-            if not items:
-                break
+                    return playlists
 
         return playlists
 
@@ -71,45 +62,11 @@ class SpotifyDataLoader:
           Optional safety cap to stop paging after N normalized tracks.
         """
 
-        tracks: List[Dict[str, Any]] = []
-        offset = 0
-
-        while True:
-            if max_tracks is not None and len(tracks) >= int(max_tracks):
-                break
-
-            page = self.client.playlist_items(playlist_id, limit=limit, offset=offset)
-            items = page.get("items") or []
-
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                track_obj = item.get("track")
-                normalized = self._normalize_track(track_obj)
-                if normalized:
-                    # preserve playlist-added timestamp if available
-                    if item.get("added_at"):
-                        normalized["added_at"] = item.get("added_at")
-                    tracks.append(normalized)
-
-                if max_tracks is not None and len(tracks) >= int(max_tracks):
-                    break
-
-            total = page.get("total")
-            if total is None:
-                break
-
-            offset += len(items)
-            if offset >= int(total):
-                break
-
-            if not items:
-                break
-
-        if max_tracks is not None and len(tracks) > int(max_tracks):
-            tracks = tracks[: int(max_tracks)]
-
-        return tracks
+        return self._load_tracks(
+            lambda limit, offset: self.client.playlist_items(playlist_id, limit=limit, offset=offset),
+            limit=limit,
+            max_tracks=max_tracks,
+        )
 
     def load_liked_songs(
         self,
@@ -123,42 +80,46 @@ class SpotifyDataLoader:
           Optional safety cap to stop paging after N normalized tracks.
         """
 
-        tracks: List[Dict[str, Any]] = []
-        offset = 0
+        return self._load_tracks(
+            lambda limit, offset: self.client.current_user_saved_tracks(limit=limit, offset=offset),
+            limit=limit,
+            max_tracks=max_tracks,
+        )
 
-        while True:
-            if max_tracks is not None and len(tracks) >= int(max_tracks):
-                break
+    def _max_workers(self) -> int:
+        return int(getattr(self.client, "max_concurrency", 1))
 
-            page = self.client.current_user_saved_tracks(limit=limit, offset=offset)
-            items = page.get("items") or []
+    def _load_tracks(
+        self,
+        fetch_page: Callable[[int, int], Dict[str, Any]],
+        *,
+        limit: int,
+        max_tracks: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Normalize the tracks of a paged {items: [{added_at, track}], total} endpoint.
 
-            for item in items:
+        Pages are fetched concurrently (see iter_pages); paging stops after max_tracks.
+        """
+
+        tracks: List[Dict[str, Any]] = []
+        if max_tracks is not None and int(max_tracks) <= 0:
+            return tracks
+
+        pages = iter_pages(fetch_page, limit=limit, max_workers=self._max_workers(), max_items=max_tracks)
+        for page in pages:
+            for item in page.get("items") or []:
                 if not isinstance(item, dict):
                     continue
                 track_obj = item.get("track")
                 normalized = self._normalize_track(track_obj)
                 if normalized:
+                    # preserve playlist-added timestamp if available
                     if item.get("added_at"):
                         normalized["added_at"] = item.get("added_at")
                     tracks.append(normalized)
 
                 if max_tracks is not None and len(tracks) >= int(max_tracks):
-                    break
-
-            total = page.get("total")
-            if total is None:
-                break
-
-            offset += len(items)
-            if offset >= int(total):
-                break
-
-            if not items:
-                break
-
-        if max_tracks is not None and len(tracks) > int(max_tracks):
-            tracks = tracks[: int(max_tracks)]
+                    return tracks
 
         return tracks
 
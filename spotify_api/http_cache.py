@@ -0,0 +1,103 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+
+DEFAULT_HTTP_CACHE_PATH = os.path.join("data", "spotify_http_cache.sqlite3")
+
+# Entries not revalidated for this long are dropped, and at most this many are kept.
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+# Pruning runs when the database is opened and after this many writes.
+PRUNE_EVERY_PUTS = 200
+
+
+class DiskCache:
+    """SQLite store of Spotify response bodies and their ETags, keyed by (owner, request URL).
+
+    `owner` identifies the login the response belongs to, so one account's entries are never
+    revalidated for another. Entries are only ever served after Spotify confirms them with a
+    304 to an If-None-Match request, so nothing is reused past what the server validates.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_HTTP_CACHE_PATH,
+        *,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.max_age_seconds = float(max_age_seconds)
+        self.max_entries = int(max_entries)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._puts = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so clients that never hit a cacheable endpoint leave no file behind.
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            if columns and "owner" not in columns:
+                # Layout from before entries were scoped per login; the cache is disposable.
+                conn.execute("DROP TABLE responses")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "owner TEXT NOT NULL, url TEXT NOT NULL, etag TEXT NOT NULL, body BLOB NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (owner, url))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)")
+            self._conn = conn
+            self._prune(conn)
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop entries older than max_age_seconds, then the oldest beyond max_entries."""
+        conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.max_age_seconds,))
+        conn.execute(
+            "DELETE FROM responses WHERE rowid IN ("
+            "SELECT rowid FROM responses ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.commit()
+
+    def get(self, owner: str, url: str) -> Optional[Tuple[str, bytes]]:
+        """Return (etag, body) stored for owner and url, or None."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag, body FROM responses WHERE owner = ? AND url = ?", (owner, url)
+            ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def put(self, owner: str, url: str, etag: str, body: bytes) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (owner, url, etag, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (owner, url, etag, sqlite3.Binary(body), time.time()),
+            )
+            conn.commit()
+            self._puts += 1
+            if self._puts % PRUNE_EVERY_PUTS == 0:
+                self._prune(conn)
+
+    def touch(self, owner: str, url: str) -> None:
+        """Mark an entry as just revalidated (a 304), so age-based eviction keeps it."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE owner = ? AND url = ?", (time.time(), owner, url)
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
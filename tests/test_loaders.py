@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+
+# Ensure local imports work when running this file directly.
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if THIS_DIR not in os.sys.path:
+    os.sys.path.insert(0, THIS_DIR)
+
+from utils import loaders
+from utils.loaders import load_exportify_playlists, load_exportify_tracks, load_primary_tracks
+
+
+def _write(path: str, content: str, encoding: str = "utf-8") -> None:
+    with open(path, "w", encoding=encoding, newline="") as f:
+        f.write(content)
+
+
+class TestExportifyCsv(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.addCleanup(self._td.cleanup)
+        self.root = self._td.name
+
+    def _load(self, content: str, name: str = "p.csv", encoding: str = "utf-8"):
+        path = os.path.join(self.root, name)
+        _write(path, content, encoding)
+        return load_exportify_tracks(path)
+
+    def test_full_row_keeps_only_non_empty_fields(self):
+        tracks = self._load(
+            "Track URI,Track Name,Artist Name(s),Album Name,Popularity,Explicit\n"
+            "spotify:track:1, Song ,A;B;a,Album,,false\n"
+        )
+        self.assertEqual(
+            tracks,
+            [{"artist": "A, B", "track": "Song", "album": "Album", "uri": "spotify:track:1", "explicit": "false"}],
+        )
+
+    def test_short_rows_and_blank_lines(self):
+        tracks = self._load(
+            "Track URI,Track Name,Artist Name(s),Album Name\n"
+            "u1,Song,Artist\n"
+            "\n"
+            "u2,Only Title\n"
+            "u3\n"
+        )
+        self.assertEqual(tracks, [{"artist": "Artist", "track": "Song", "uri": "u1"}])
+
+    def test_duplicate_header_uses_last_column(self):
+        tracks = self._load("Track Name,Artist Name(s),Track Name\nFirst,Artist,Second\n")
+        self.assertEqual(tracks, [{"artist": "Artist", "track": "Second"}])
+
+    def test_artist_and_track_fallback_columns(self):
+        tracks = self._load(
+            "Track,Artist,Track Name,Artist Name(s)\n"
+            "Fallback Song,Fallback Artist,,\n"
+            "Other,Other Artist,Song,Artist\n"
+        )
+        self.assertEqual(
+            tracks,
+            [{"artist": "Fallback Artist", "track": "Fallback Song"}, {"artist": "Artist", "track": "Song"}],
+        )
+
+    def test_bom_is_stripped_from_first_header(self):
+        tracks = self._load("Track Name,Artist Name(s)\nSong,Artist\n", encoding="utf-8-sig")
+        self.assertEqual(tracks, [{"artist": "Artist", "track": "Song"}])
+
+    def test_empty_and_header_only_files(self):
+        self.assertEqual(self._load("", name="empty.csv"), [])
+        self.assertEqual(self._load("Track Name,Artist Name(s)\n", name="header.csv"), [])
+        self.assertEqual(self._load("Album Name\nAlbum\n", name="no-columns.csv"), [])
+        self.assertEqual(load_exportify_tracks(os.path.join(self.root, "missing.csv")), [])
+
+    def test_unchanged_file_is_not_reparsed(self):
+        path = os.path.join(self.root, "p.csv")
+        _write(path, "Track Name,Artist Name(s)\nSong,Artist\n")
+        first = load_exportify_tracks(path)
+
+        before = loaders._load_exportify_cached.cache_info().hits
+        second = load_exportify_tracks(path)
+        self.assertEqual(loaders._load_exportify_cached.cache_info().hits, before + 1)
+        self.assertEqual(first, second)
+
+        # Callers get their own dicts.
+        second[0]["track"] = "Edited"
+        self.assertEqual(load_exportify_tracks(path)[0]["track"], "Song")
+
+        st = os.stat(path)
+        _write(path, "Track Name,Artist Name(s)\nSong,Artist\nNew,Artist\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(len(load_exportify_tracks(path)), 2)
+
+    def test_primary_csv_folder_merges_and_dedupes(self):
+        folder = os.path.join(self.root, "exportify")
+        os.makedirs(folder)
+        _write(os.path.join(folder, "a.csv"), "Track Name,Artist Name(s)\nSong,Artist\nOther,Artist\n")
+        _write(os.path.join(folder, "b.CSV"), "Track Name,Artist Name(s)\nSONG,artist\nThird,Artist\n")
+
+        tracks = load_primary_tracks({"primary_input_source": "csv", "exportify_watch_folder": folder})
+        self.assertEqual([t["track"] for t in tracks], ["Song", "Other", "Third"])
+
+
+class TestExportifyPlaylists(unittest.TestCase):
+    def test_playlists_keep_directory_order_and_skip_empty_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            names = [f"Playlist {i}" for i in range(6)]
+            for i, name in enumerate(names):
+                _write(os.path.join(td, f"{name}.csv"), f"Track Name,Artist Name(s)\nSong {i},Artist\n")
+            _write(os.path.join(td, "Empty.csv"), "")
+            _write(os.path.join(td, "notes.txt"), "ignored")
+
+            with os.scandir(td) as it:
+                expected = [os.path.splitext(e.name)[0] for e in it if e.name.endswith(".csv") and e.name != "Empty.csv"]
+
+            playlists = load_exportify_playlists(td)
+            self.assertEqual([p["name"] for p in playlists], expected)
+            for p in playlists:
+                self.assertEqual(p["tracks"], [{"artist": "Artist", "track": f"Song {names.index(p['name'])}"}])
+
+    def test_missing_folder_has_no_playlists(self):
+        self.assertEqual(load_exportify_playlists(os.path.join(tempfile.gettempdir(), "no-such-exportify")), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
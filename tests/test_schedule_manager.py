@@ -0,0 +1,66 @@
+import os
+import unittest
+from unittest import mock
+
+# Ensure local imports work when running this file directly.
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if THIS_DIR not in os.sys.path:
+    os.sys.path.insert(0, THIS_DIR)
+
+import schedule
+
+from managers import schedule_manager
+
+
+class TestScheduleDownload(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(schedule.clear)
+
+    def test_schedule_download_can_run_twice_in_a_session(self):
+        config = {"output_dir": "unused", "audio_format": "mp3"}
+        pending = [{"artist": "A", "track": "T"}]
+
+        def run_due_then_stop(delay):
+            # Force every registered job due now (run_all would call the patched sleep).
+            for job in list(schedule.get_jobs()):
+                job.run()
+            raise KeyboardInterrupt
+
+        with mock.patch("builtins.input", return_value="12:00"), \
+                mock.patch.object(schedule_manager, "load_primary_tracks", return_value=pending), \
+                mock.patch("utils.track_checker.check_downloaded_files", return_value=(0, pending)), \
+                mock.patch.object(schedule_manager, "batch_download", new_callable=mock.AsyncMock) as download, \
+                mock.patch.object(schedule_manager.time, "sleep", side_effect=run_due_then_stop), \
+                mock.patch.object(schedule_manager, "log_error") as log_error:
+            schedule_manager.schedule_download(config)
+            self.assertEqual(schedule.get_jobs(), [])
+            schedule_manager.schedule_download(config)
+
+        self.assertEqual(download.await_count, 2)
+        log_error.assert_not_called()
+        self.assertEqual(schedule.get_jobs(), [])
+
+    def test_failing_job_is_logged_and_keeps_scheduler_alive(self):
+        runs = []
+
+        def run_due(delay):
+            runs.append(delay)
+            # Force every registered job due now (run_all would call the patched sleep).
+            for job in list(schedule.get_jobs()):
+                job.run()
+            if len(runs) == 2:
+                raise KeyboardInterrupt
+
+        with mock.patch("builtins.input", return_value="12:00"), \
+                mock.patch.object(schedule_manager, "load_primary_tracks", side_effect=OSError("boom")), \
+                mock.patch.object(schedule_manager.time, "sleep", side_effect=run_due), \
+                mock.patch.object(schedule_manager, "log_error") as log_error:
+            schedule_manager.schedule_download({"output_dir": "unused", "audio_format": "mp3"})
+
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(log_error.call_count, 2)
+        self.assertIn("boom", log_error.call_args[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
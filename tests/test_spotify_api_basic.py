@@ -2,7 +2,10 @@ import base64
 import hashlib
 import os
 import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 
 # Ensure local imports work when running this file directly.
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -10,8 +13,11 @@ if THIS_DIR not in os.sys.path:
     os.sys.path.insert(0, THIS_DIR)
 
 from spotify_api.auth import SpotifyPKCEAuth, code_challenge_from_verifier, extract_code_from_redirect_url
+from spotify_api import client as client_module
+from spotify_api.client import SpotifyClient, _TokenBucket, _parse_retry_after
 from spotify_api.token_manager import TokenInfo, TokenManager
 from spotify_api.data_loader import SpotifyDataLoader
+from spotify_api.http_cache import DiskCache
 
 
 class TestSpotifyAuthHelpers(unittest.TestCase):
@@ -61,6 +67,252 @@ class TestSpotifyTokenManager(unittest.TestCase):
             self.assertEqual(loaded.refresh_token, "rt")
 
 
+class TestSpotifyClientTokenRefresh(unittest.TestCase):
+    def setUp(self):
+        # Refresh results are shared process-wide per refresh token.
+        client_module.clear_refreshed_tokens()
+
+    def test_concurrent_refreshes_share_one_request(self):
+        expired = TokenInfo(access_token="old", token_type="Bearer", expires_at=0.0, refresh_token="rt")
+        fresh = TokenInfo(access_token="new", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt")
+        calls = []
+
+        def fake_refresh(self, *, refresh_token):
+            calls.append(refresh_token)
+            time.sleep(0.2)
+            return fresh
+
+        cfg = {"spotify_client_id": "example-client-id", "spotify_cache_tokens": False}
+        clients = [SpotifyClient(cfg) for _ in range(4)]
+        for c in clients:
+            c._token = expired
+
+        results = []
+        with mock.patch.object(SpotifyPKCEAuth, "refresh_access_token", fake_refresh):
+            threads = [threading.Thread(target=lambda c=c: results.append(c.get_token())) for c in clients]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([t.access_token for t in results], ["new"] * 4)
+
+    def test_late_401_reuses_token_refreshed_by_another_client(self):
+        cfg = {"spotify_client_id": "late-401-client-id", "spotify_cache_tokens": False, "spotify_retry_jitter": 0.0}
+        old = TokenInfo(access_token="old", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt")
+        fresh = TokenInfo(access_token="new", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt")
+        first, second = SpotifyClient(cfg), SpotifyClient(cfg)
+        for c in (first, second):
+            c._token = old
+            c._rate_buckets = ()
+
+        with mock.patch.object(SpotifyPKCEAuth, "refresh_access_token", return_value=fresh) as refresh, \
+                mock.patch("spotify_api.client.log_warning") as warn:
+            for c in (first, second):
+                with mock.patch.object(c, "_send", side_effect=[(401, {}, b""), (200, {}, b"{}")]):
+                    self.assertEqual(c.request_json("GET", "/me"), {})
+                self.assertEqual(c._token.access_token, "new")
+
+        self.assertEqual(refresh.call_count, 1)
+        # A 401 resolved by a refresh is not an auth failure worth diagnosing.
+        warn.assert_not_called()
+
+    def test_refresh_result_is_not_shared_with_another_login(self):
+        cfg = {"spotify_client_id": "shared-app-id", "spotify_cache_tokens": False}
+        first = TokenInfo(access_token="a1", token_type="Bearer", expires_at=0.0, refresh_token="rt-a")
+        other = TokenInfo(access_token="b1", token_type="Bearer", expires_at=0.0, refresh_token="rt-b")
+        fresh_a = TokenInfo(access_token="a2", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt-a")
+        fresh_b = TokenInfo(access_token="b2", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt-b")
+        responses = {"rt-a": fresh_a, "rt-b": fresh_b}
+
+        def fake_refresh(self, *, refresh_token):
+            return responses[refresh_token]
+
+        a, b = SpotifyClient(cfg), SpotifyClient(cfg)
+        a._token, b._token = first, other
+        with mock.patch.object(SpotifyPKCEAuth, "refresh_access_token", fake_refresh):
+            self.assertEqual(a.get_token().access_token, "a2")
+            # Same app credentials, different account: must refresh its own token.
+            self.assertEqual(b.get_token().access_token, "b2")
+
+        client_module.clear_refreshed_tokens()
+        self.assertNotIn("rt-a", client_module._refreshed)
+
+
+class TestSpotifyClientRequests(unittest.TestCase):
+    def _client(self):
+        client = SpotifyClient({"spotify_retry_jitter": 0.0, "spotify_cache_tokens": False, "spotify_http_cache": False})
+        client._token = TokenInfo(access_token="at", token_type="Bearer", expires_at=9999999999.0)
+        client._rate_buckets = ()
+        return client
+
+    def test_request_json_retries_after_429(self):
+        client = self._client()
+        responses = [(429, {"Retry-After": "0"}, b""), (200, {}, b'{"id": "me"}')]
+        with mock.patch.object(client, "_send", side_effect=responses) as send, mock.patch("spotify_api.client.time.sleep"):
+            self.assertEqual(client.request_json("GET", "/me"), {"id": "me"})
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(send.call_args[0][2]["Authorization"], "Bearer at")
+
+    def test_authorization_header_is_cached_until_token_changes(self):
+        client = self._client()
+        with mock.patch.object(client, "get_token", wraps=client.get_token) as get_token:
+            self.assertEqual(client._authorization(), "Bearer at")
+            self.assertEqual(client._authorization(), "Bearer at")
+            self.assertEqual(get_token.call_count, 1)
+
+            client._token = TokenInfo(access_token="new", token_type="Bearer", expires_at=9999999999.0)
+            self.assertEqual(client._authorization(), "Bearer new")
+            self.assertEqual(get_token.call_count, 2)
+
+    def test_request_json_raises_server_message(self):
+        client = self._client()
+        with mock.patch.object(client, "_send", return_value=(404, {}, b'{"error": {"message": "Not found"}}')):
+            with self.assertRaisesRegex(RuntimeError, "Spotify API error 404: Not found"):
+                client.request_json("GET", "/playlists/x")
+
+    def test_paginate_fetches_remaining_pages_in_order(self):
+        client = self._client()
+        offsets = []
+
+        def fake_request_json(method, path, *, params=None):
+            offsets.append(params["offset"])
+            start, limit = params["offset"], params["limit"]
+            return {"items": [{"n": n} for n in range(start, min(start + limit, 237))], "total": 237, "limit": limit}
+
+        with mock.patch.object(client, "request_json", side_effect=fake_request_json):
+            items = client._paginate("/me/tracks", params={"limit": 50})
+
+        self.assertEqual([x["n"] for x in items], list(range(237)))
+        self.assertEqual(sorted(offsets), [0, 50, 100, 150, 200])
+
+    def test_playlist_items_requests_projected_fields(self):
+        client = self._client()
+        with mock.patch.object(client, "_send", return_value=(200, {}, b'{"items": [], "total": 0}')) as send:
+            client.playlist_items("pl", limit=100, offset=0)
+            client.playlist_items("pl", fields=None)
+
+        projected, full = (c[0][1] for c in send.call_args_list)
+        self.assertIn("fields=items%28added_at%2Ctrack%28", projected)
+        self.assertNotIn("fields=", full)
+
+    def test_playlist_responses_are_revalidated_with_etag(self):
+        client = self._client()
+        with tempfile.TemporaryDirectory() as td:
+            client._http_cache = DiskCache(os.path.join(td, "cache.sqlite3"))
+            responses = [
+                (200, {}, b'{"id": "u1"}'),
+                (200, {"etag": '"v1"'}, b'{"items": [{"id": "p"}], "total": 1}'),
+                (304, {}, b""),
+            ]
+            with mock.patch.object(client, "_send", side_effect=responses) as send:
+                first = client.current_user_playlists()
+                second = client.current_user_playlists()
+            client.close()
+
+            self.assertEqual(first, second)
+            # /me is looked up once for the cache owner, not per request.
+            self.assertEqual(send.call_count, 3)
+            self.assertNotIn("If-None-Match", send.call_args_list[1][0][2])
+            self.assertEqual(send.call_args_list[2][0][2]["If-None-Match"], '"v1"')
+
+    def test_etag_cache_survives_refresh_token_rotation(self):
+        body = b'{"items": [{"id": "p"}], "total": 1}'
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "cache.sqlite3")
+            client = self._client()
+            client._token = TokenInfo(access_token="at", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt1")
+            client._http_cache = DiskCache(path)
+            with mock.patch.object(client, "_send", side_effect=[(200, {}, b'{"id": "u1"}'), (200, {"ETag": '"v1"'}, body)]):
+                first = client.current_user_playlists()
+            client.close()
+
+            # A later run holds the rotated refresh token (and a new access token) for the same account.
+            client = self._client()
+            client._token = TokenInfo(access_token="at2", token_type="Bearer", expires_at=9999999999.0, refresh_token="rt2")
+            client._http_cache = DiskCache(path)
+            with mock.patch.object(client, "_send", side_effect=[(200, {}, b'{"id": "u1"}'), (304, {}, b"")]) as send:
+                second = client.current_user_playlists()
+            client.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(send.call_args_list[1][0][2]["If-None-Match"], '"v1"')
+
+    def test_etag_cache_is_scoped_to_the_login(self):
+        client = self._client()
+        with tempfile.TemporaryDirectory() as td:
+            client._http_cache = DiskCache(os.path.join(td, "cache.sqlite3"))
+            body = b'{"items": [{"id": "p"}], "total": 1}'
+            responses = [
+                (200, {}, b'{"id": "u1"}'),
+                (200, {"ETag": '"v1"'}, body),
+                (200, {}, b'{"id": "u2"}'),
+                (200, {"ETag": '"v2"'}, body),
+            ]
+            with mock.patch.object(client, "_send", side_effect=responses) as send:
+                client.current_user_playlists()
+                client.set_token(TokenInfo(access_token="other", token_type="Bearer", expires_at=9999999999.0))
+                client.current_user_playlists()
+            client.close()
+
+        # Another account never sends the first account's ETag.
+        self.assertNotIn("If-None-Match", send.call_args_list[3][0][2])
+
+    def test_disk_cache_evicts_old_and_excess_entries(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "cache.sqlite3")
+            cache = DiskCache(path, max_age_seconds=60, max_entries=2)
+            with mock.patch("spotify_api.http_cache.time.time", return_value=1000.0):
+                cache.put("me", "/stale", '"s"', b"{}")
+            for n in range(3):
+                with mock.patch("spotify_api.http_cache.time.time", return_value=5000.0 + n):
+                    cache.put("me", f"/u{n}", f'"e{n}"', b"{}")
+            cache.close()
+
+            # Pruning runs when the database is reopened.
+            reopened = DiskCache(path, max_age_seconds=60, max_entries=2)
+            with mock.patch("spotify_api.http_cache.time.time", return_value=5010.0):
+                self.assertIsNone(reopened.get("me", "/stale"))
+            self.assertIsNone(reopened.get("me", "/u0"))
+            self.assertEqual(reopened.get("me", "/u2"), ('"e2"', b"{}"))
+            self.assertIsNone(reopened.get("you", "/u2"))
+            reopened.close()
+
+    def test_get_tracks_batches_fifty_ids_per_request(self):
+        client = self._client()
+        requested = []
+
+        def fake_request_json(method, path, *, params=None):
+            ids = params["ids"].split(",")
+            requested.append(len(ids))
+            return {"tracks": [None if i == "missing" else {"id": i} for i in ids]}
+
+        ids = [str(n) for n in range(120)] + ["missing"]
+        with mock.patch.object(client, "request_json", side_effect=fake_request_json):
+            tracks = client.get_tracks(ids)
+
+        self.assertEqual(sorted(requested), [21, 50, 50])
+        self.assertEqual([t["id"] for t in tracks], [str(n) for n in range(120)])
+
+
+class TestSpotifyRateLimiting(unittest.TestCase):
+    def test_parse_retry_after_accepts_seconds_and_http_date(self):
+        self.assertEqual(_parse_retry_after("7"), 7.0)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertEqual(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_token_bucket_allows_burst_then_paces(self):
+        bucket = _TokenBucket(5, 1.0)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.1)
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+
 class TestSpotifyNormalization(unittest.TestCase):
     def test_normalize_track_shape(self):
         sample = {
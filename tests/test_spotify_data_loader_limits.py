@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 import unittest
 
 # Ensure local imports work when running this file directly.
@@ -83,6 +85,21 @@ class FakeSpotifyClient:
         return {"items": items, "total": self.total_playlists, "limit": limit, "offset": offset}
 
 
+class ConcurrentFakeSpotifyClient(FakeSpotifyClient):
+    max_concurrency = 4
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.offsets = []
+        self.threads = set()
+
+    def playlist_items(self, playlist_id: str, *, limit: int = 100, offset: int = 0):
+        self.offsets.append(offset)
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return super().playlist_items(playlist_id, limit=limit, offset=offset)
+
+
 class TestSpotifyDataLoaderLimits(unittest.TestCase):
     def test_load_liked_songs_max_tracks_caps_results(self):
         loader = SpotifyDataLoader(FakeSpotifyClient(total_liked=120))
@@ -106,6 +123,19 @@ class TestSpotifyDataLoaderLimits(unittest.TestCase):
         self.assertEqual(pls[0]["id"], "playlist0")
         self.assertEqual(pls[-1]["id"], "playlist19")
 
+    def test_playlist_pages_are_fetched_concurrently_in_order(self):
+        client = ConcurrentFakeSpotifyClient(total_playlist_tracks=1000)
+        tracks = SpotifyDataLoader(client).load_playlist_tracks("any")
+        self.assertEqual([t["spotify_id"] for t in tracks], [f"pl{i}" for i in range(1000)])
+        self.assertEqual(sorted(client.offsets), list(range(0, 1000, 100)))
+        self.assertGreater(len(client.threads), 1)
+
+    def test_capped_load_does_not_fetch_pages_past_the_cap(self):
+        client = ConcurrentFakeSpotifyClient(total_playlist_tracks=1000)
+        tracks = SpotifyDataLoader(client).load_playlist_tracks("any", max_tracks=250)
+        self.assertEqual(len(tracks), 250)
+        self.assertEqual(sorted(client.offsets), [0, 100, 200])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
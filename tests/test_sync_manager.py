@@ -0,0 +1,214 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Ensure local imports work when running this file directly.
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if THIS_DIR not in os.sys.path:
+    os.sys.path.insert(0, THIS_DIR)
+
+from managers import sync_manager
+from utils.loaders import load_tracks, tracks_log_path
+
+
+CSV_HEADER = "Track URI,Track Name,Artist Name(s),Album Name\n"
+
+
+def _write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestSyncManager(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = self._td.name
+        self.exportify_dir = os.path.join(self.root, "exportify")
+        os.makedirs(self.exportify_dir)
+
+        patcher = mock.patch.object(sync_manager, "SYNC_STATE_FILE", os.path.join(self.root, "sync_state.json"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._td.cleanup)
+
+    def test_get_file_hash_tracks_content(self):
+        path = os.path.join(self.root, "a.csv")
+        _write(path, CSV_HEADER)
+        first = sync_manager.get_file_hash(path)
+        self.assertEqual(first, sync_manager.get_file_hash(path))
+
+        _write(path, CSV_HEADER + "spotify:track:1,Song,Artist,Album\n")
+        self.assertNotEqual(first, sync_manager.get_file_hash(path))
+
+    def test_get_file_hash_handles_empty_file(self):
+        path = os.path.join(self.root, "empty.csv")
+        _write(path, "")
+        self.assertTrue(sync_manager.get_file_hash(path))
+
+    def test_load_sync_state_hands_out_independent_copies(self):
+        sync_manager.save_sync_state({"synced_files": {"a.csv": {"hash": "h"}}, "last_sync": None})
+
+        first = sync_manager.load_sync_state()
+        first["synced_files"]["b.csv"] = {"hash": "x"}
+        self.assertEqual(list(sync_manager.load_sync_state()["synced_files"]), ["a.csv"])
+
+    def test_detect_new_files_skips_synced_files(self):
+        path = os.path.join(self.exportify_dir, "playlist.csv")
+        _write(path, CSV_HEADER + "spotify:track:1,Song,Artist,Album\n")
+        _write(os.path.join(self.exportify_dir, "notes.txt"), "ignored")
+
+        new_files = sync_manager.detect_new_files(self.exportify_dir)
+        self.assertEqual([f["filename"] for f in new_files], ["playlist.csv"])
+        self.assertTrue(new_files[0]["is_new"])
+
+        config = {"exportify_watch_folder": self.exportify_dir, "sync_write_tracks_json": False}
+        results = sync_manager.sync_exportify_folder(config)
+        self.assertEqual(results["new_files"], 1)
+        self.assertEqual(results["new_tracks"], 1)
+
+        self.assertEqual(sync_manager.detect_new_files(self.exportify_dir), [])
+
+    def test_detect_new_files_skips_hashing_unchanged_files(self):
+        path = os.path.join(self.exportify_dir, "playlist.csv")
+        _write(path, CSV_HEADER + "spotify:track:1,Song,Artist,Album\n")
+        sync_manager.sync_exportify_folder({"exportify_watch_folder": self.exportify_dir, "sync_write_tracks_json": False})
+
+        with mock.patch.object(sync_manager, "get_file_hash", side_effect=AssertionError("hashed")):
+            self.assertEqual(sync_manager.detect_new_files(self.exportify_dir), [])
+
+        # A touched file with identical content is hashed but not reported.
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(sync_manager.detect_new_files(self.exportify_dir), [])
+
+    def test_sync_appends_new_tracks_to_log_until_compaction(self):
+        tracks_file = os.path.join(self.root, "tracks.json")
+        base = [{"artist": f"Artist {i}", "album": "", "track": f"Song {i}", "uri": ""} for i in range(4)]
+        with open(tracks_file, "w", encoding="utf-8") as f:
+            json.dump({"tracks": base}, f)
+
+        config = {
+            "exportify_watch_folder": self.exportify_dir,
+            "tracks_file": tracks_file,
+            "sync_write_tracks_json": True,
+            "auto_backup": False,
+        }
+
+        _write(os.path.join(self.exportify_dir, "a.csv"), CSV_HEADER + "spotify:track:1,New 1,Artist,Album\n")
+        results = sync_manager.sync_exportify_folder(config)
+        self.assertEqual(results["new_tracks"], 1)
+        self.assertTrue(os.path.exists(tracks_log_path(tracks_file)))
+        with open(tracks_file, "r", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["tracks"]), 4)
+        self.assertEqual(len(load_tracks(tracks_file)), 5)
+
+        _write(os.path.join(self.exportify_dir, "b.csv"), CSV_HEADER + "spotify:track:2,New 2,Artist,Album\n")
+        sync_manager.sync_exportify_folder(config)
+        self.assertFalse(os.path.exists(tracks_log_path(tracks_file)))
+        with open(tracks_file, "r", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["tracks"]), 6)
+        self.assertEqual(len(load_tracks(tracks_file)), 6)
+
+    def test_compaction_interrupted_before_log_removal_does_not_duplicate(self):
+        tracks_file = os.path.join(self.root, "tracks.json")
+        base = [{"artist": f"Artist {i}", "album": "", "track": f"Song {i}", "uri": ""} for i in range(4)]
+        with open(tracks_file, "w", encoding="utf-8") as f:
+            json.dump({"tracks": base}, f)
+
+        config = {
+            "exportify_watch_folder": self.exportify_dir,
+            "tracks_file": tracks_file,
+            "sync_write_tracks_json": True,
+            "auto_backup": False,
+        }
+        log_path = tracks_log_path(tracks_file)
+        _write(os.path.join(self.exportify_dir, "a.csv"), CSV_HEADER + "spotify:track:1,New 1,Artist,Album\n")
+        sync_manager.sync_exportify_folder(config)
+
+        # Crash after tracks.json is rewritten but before the log is removed.
+        real_remove = os.remove
+
+        def crash_on_log(path):
+            if path == log_path:
+                raise OSError("simulated crash")
+            real_remove(path)
+
+        _write(os.path.join(self.exportify_dir, "b.csv"), CSV_HEADER + "spotify:track:2,New 2,Artist,Album\n")
+        with mock.patch.object(sync_manager.os, "remove", side_effect=crash_on_log):
+            sync_manager.sync_exportify_folder(config)
+        self.assertTrue(os.path.exists(log_path))
+        with open(tracks_file, "r", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["tracks"]), 6)
+        self.assertEqual(len(load_tracks(tracks_file)), 6)
+
+        _write(os.path.join(self.exportify_dir, "c.csv"), CSV_HEADER + "spotify:track:3,New 3,Artist,Album\n")
+        results = sync_manager.sync_exportify_folder(config)
+        self.assertEqual(results["new_tracks"], 1)
+        titles = [t["track"] for t in load_tracks(tracks_file)]
+        self.assertEqual(len(titles), 7)
+        self.assertEqual(len(set(titles)), 7)
+
+    def test_schedule_sync_can_run_twice_in_a_session(self):
+        import schedule
+
+        self.addCleanup(schedule.clear)
+        calls = []
+
+        def fake_sync(config):
+            calls.append(config)
+            return {"new_tracks": 0}
+
+        def run_due_then_stop(delay):
+            # Force every registered job due now (run_all would call the patched sleep).
+            for job in list(schedule.get_jobs()):
+                job.run()
+            raise KeyboardInterrupt
+
+        with mock.patch.object(sync_manager, "sync_exportify_folder", side_effect=fake_sync), \
+                mock.patch.object(sync_manager.time, "sleep", side_effect=run_due_then_stop):
+            sync_manager.schedule_sync({}, interval_seconds=60)
+            self.assertEqual(schedule.get_jobs(), [])
+            sync_manager.schedule_sync({}, interval_seconds=60)
+            # The first scheduler's job is gone, so only the live one fires.
+            schedule.run_pending()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(schedule.get_jobs(), [])
+
+    def test_backup_and_restore_cover_the_tracks_log(self):
+        from managers import backup_manager
+
+        backup_dir = os.path.join(self.root, "backups")
+        patcher = mock.patch.object(backup_manager, "BACKUP_DIR", backup_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        tracks_file = os.path.join(self.root, "tracks.json")
+        base = [{"artist": f"Artist {i}", "album": "", "track": f"Song {i}", "uri": ""} for i in range(8)]
+        with open(tracks_file, "w", encoding="utf-8") as f:
+            json.dump({"tracks": base}, f)
+
+        config = {"exportify_watch_folder": self.exportify_dir, "tracks_file": tracks_file, "max_backups": 0}
+        _write(os.path.join(self.exportify_dir, "a.csv"), CSV_HEADER + "spotify:track:1,New 1,Artist,Album\n")
+        sync_manager.sync_exportify_folder(config)
+        self.assertTrue(os.path.exists(tracks_log_path(tracks_file)))
+
+        # The backup taken before this append holds the 8 base tracks; a fresh one includes the log.
+        backup = backup_manager.backup_json_file(tracks_file, config)
+        with open(backup, "r", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["tracks"]), 9)
+
+        # Keep it apart from the pre-restore backup, which may get the same timestamped name.
+        saved = os.path.join(self.root, "saved.json")
+        os.replace(backup, saved)
+        with open(tracks_file, "w", encoding="utf-8") as f:
+            json.dump({"tracks": []}, f)
+        self.assertTrue(backup_manager.restore_backup(saved, tracks_file))
+        self.assertFalse(os.path.exists(tracks_log_path(tracks_file)))
+        self.assertEqual(len(load_tracks(tracks_file)), 9)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Ensure local imports work when running this file directly.
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if THIS_DIR not in os.sys.path:
+    os.sys.path.insert(0, THIS_DIR)
+
+from utils.track_checker import (
+    check_downloaded_files,
+    check_downloaded_playlists,
+    count_existing_for_tracks,
+    existing_track_keys_cached,
+    existing_track_keys_in_dir,
+    resolve_playlist_dir,
+    sanitize_filename,
+    sanitize_playlist_name,
+    track_key,
+)
+
+
+def _touch(path: str) -> None:
+    with open(path, "wb"):
+        pass
+
+
+class TestTrackKeys(unittest.TestCase):
+    def test_track_key_matches_downloaded_filename(self):
+        with tempfile.TemporaryDirectory() as td:
+            _touch(os.path.join(td, "AC-DC - Back In Black.mp3"))
+            _touch(os.path.join(td, "Artist - Song.flac"))
+            _touch(os.path.join(td, "cover.jpg"))
+
+            keys = existing_track_keys_in_dir(td)
+            self.assertEqual(len(keys), 2)
+            self.assertIn(track_key({"artist": "AC/DC", "track": "Back in Black"}), keys)
+            self.assertIn(track_key({"artist": " artist ", "track": "SONG"}), keys)
+
+    def test_missing_dir_has_no_keys(self):
+        missing = os.path.join(tempfile.gettempdir(), "does-not-exist-track-checker")
+        self.assertEqual(existing_track_keys_in_dir(missing), set())
+        self.assertEqual(existing_track_keys_cached(missing), frozenset())
+
+    def test_cached_keys_tolerate_bad_folder_paths(self):
+        with tempfile.TemporaryDirectory() as td:
+            not_a_dir = os.path.join(td, "file.mp3")
+            _touch(not_a_dir)
+            self.assertEqual(existing_track_keys_cached(not_a_dir), frozenset())
+            self.assertEqual(count_existing_for_tracks(not_a_dir, {"a - b"}), 0)
+
+            # Folder removed between the stat and the scan.
+            gone = os.path.join(td, "gone")
+            os.makedirs(gone)
+            with mock.patch("utils.track_checker.os.scandir", side_effect=PermissionError("denied")):
+                self.assertEqual(existing_track_keys_cached(gone), frozenset())
+
+    def test_cached_keys_refresh_when_folder_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            _touch(os.path.join(td, "A - One.mp3"))
+            self.assertEqual(len(existing_track_keys_cached(td)), 1)
+
+            _touch(os.path.join(td, "A - Two.mp3"))
+            st = os.stat(td)
+            os.utime(td, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(len(existing_track_keys_cached(td)), 2)
+
+    def test_count_existing_for_tracks(self):
+        with tempfile.TemporaryDirectory() as td:
+            _touch(os.path.join(td, "A - One.mp3"))
+            keys = {track_key({"artist": "A", "track": "One"}), track_key({"artist": "A", "track": "Two"})}
+            self.assertEqual(count_existing_for_tracks(td, keys), 1)
+
+    def test_sanitize_playlist_name_replaces_unsafe_characters(self):
+        self.assertEqual(sanitize_playlist_name(' Rock/Pop: "Best" <2020>? '), 'Rock-Pop- -Best- -2020--')
+        self.assertEqual(sanitize_playlist_name(None), "")
+
+    def test_resolve_playlist_dir_reuses_legacy_folder(self):
+        with tempfile.TemporaryDirectory() as td:
+            self.assertEqual(resolve_playlist_dir(td, "Rock: Best"), os.path.join(td, "Rock- Best"))
+
+            # Created when only "/" was replaced.
+            os.makedirs(os.path.join(td, "Rock: Best"))
+            _touch(os.path.join(td, "Rock: Best", "A - One.mp3"))
+            self.assertEqual(resolve_playlist_dir(td, "Rock: Best"), os.path.join(td, "Rock: Best"))
+
+            downloaded, pending = check_downloaded_playlists(td, [{"name": "Rock: Best", "tracks": [{"artist": "A", "track": "One"}]}])
+            self.assertEqual(([p["name"] for p in downloaded], pending), (["Rock: Best"], []))
+
+            # Once the current folder exists it wins.
+            os.makedirs(os.path.join(td, "Rock- Best"))
+            self.assertEqual(resolve_playlist_dir(td, "Rock: Best"), os.path.join(td, "Rock- Best"))
+
+    def test_sanitize_filename_matches_track_key(self):
+        self.assertEqual(sanitize_filename("AC/DC", 'What: "Live"?'), "AC-DC - What- -Live--")
+        self.assertEqual(track_key({"artist": "AC/DC", "track": 'What: "Live"?'}), "ac-dc - what- -live--")
+
+    def test_files_named_by_legacy_rule_count_as_downloaded(self):
+        # Before sanitize_filename only "/" was replaced, so older files keep ":" and "?".
+        track = {"artist": "Artist", "track": "What's Up?: Live"}
+        with tempfile.TemporaryDirectory() as td:
+            _touch(os.path.join(td, "Artist - What's Up?: Live.mp3"))
+            self.assertEqual(count_existing_for_tracks(td, {track_key(track)}), 1)
+
+            downloaded, pending = check_downloaded_files(td, [track])
+            self.assertEqual((downloaded, pending), (1, []))
+
+            many = [track] + [{"artist": "A", "track": str(i)} for i in range(40)]
+            downloaded, pending = check_downloaded_files(td, many)
+            self.assertEqual(downloaded, 1)
+            self.assertNotIn(track, pending)
+
+    def test_check_downloaded_playlists_small_and_large(self):
+        with tempfile.TemporaryDirectory() as td:
+            os.makedirs(os.path.join(td, "Small"))
+            os.makedirs(os.path.join(td, "Large"))
+            _touch(os.path.join(td, "Small", "AC-DC - Thunder.mp3"))
+            for i in range(0, 40, 2):
+                _touch(os.path.join(td, "Large", f"A - {i}.mp3"))
+
+            small = {"name": "Small", "tracks": [{"artist": "AC/DC", "track": "Thunder"}]}
+            large = {"name": "Large", "tracks": [{"artist": "A", "track": str(i)} for i in range(40)]}
+            legacy = {"name": "Missing", "items": [{"track": {"artistName": "B", "trackName": "X"}}]}
+
+            downloaded, pending = check_downloaded_playlists(td, [small, large, legacy])
+            self.assertEqual([p["name"] for p in downloaded], ["Small"])
+            self.assertEqual([p["name"] for p in pending], ["Large", "Missing"])
+            self.assertEqual(len(pending[0]["tracks"]), 20)
+            self.assertEqual(pending[1]["tracks"], [{"artist": "B", "track": "X"}])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,3 +1,3 @@
 from .logger import log_info, log_error, log_success, log_warning, setup_logging
-from .track_checker import check_downloaded_files
+from .track_checker import check_downloaded_files, sanitize_filename
 from .system import system_check
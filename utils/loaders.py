@@ -1,8 +1,27 @@
 import os
 import csv
+import json
+import sys
+from functools import lru_cache
+from constants import CSV_SUFFIXES
 from utils.logger import log_info, log_warning, log_error
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
+
+def _read_json_file(path: str):
+    """Parse a JSON file straight from its bytes (orjson when available, else json)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=65536)
 def _normalize_artists(raw: str) -> str:
     """Normalize Exportify's semicolon-separated Artist Name(s) field to a search-friendly string."""
     raw = (raw or "").strip()
@@ -31,46 +50,53 @@ def _normalize_artists(raw: str) -> str:
     return ", ".join(uniq)
 
 
-def _extract_csv_metadata(row: dict) -> dict:
-    """Extract comprehensive metadata from Exportify CSV row."""
-    # Standard fields
-    artist_raw = (row.get("Artist Name(s)") or row.get("Artist") or "").strip()
-    track_name = (row.get("Track Name") or row.get("Track") or "").strip()
-    
-    artist = _normalize_artists(artist_raw)
-    
-    # Extract all available metadata fields from Exportify CSV
-    metadata = {
-        "artist": artist,
-        "track": track_name,
-        "album": (row.get("Album Name") or "").strip(),
-        "uri": (row.get("Track URI") or "").strip(),
-        
-        # Extended metadata
-        "release_date": (row.get("Release Date") or "").strip(),
-        "genres": (row.get("Genres") or "").strip(),
-        "record_label": (row.get("Record Label") or "").strip(),
-        "duration_ms": (row.get("Duration (ms)") or "").strip(),
-        "popularity": (row.get("Popularity") or "").strip(),
-        "explicit": (row.get("Explicit") or "").strip(),
-        
-        # Audio analysis features (if available)
-        "danceability": (row.get("Danceability") or "").strip(),
-        "energy": (row.get("Energy") or "").strip(),
-        "key": (row.get("Key") or "").strip(),
-        "loudness": (row.get("Loudness") or "").strip(),
-        "mode": (row.get("Mode") or "").strip(),
-        "speechiness": (row.get("Speechiness") or "").strip(),
-        "acousticness": (row.get("Acousticness") or "").strip(),
-        "instrumentalness": (row.get("Instrumentalness") or "").strip(),
-        "liveness": (row.get("Liveness") or "").strip(),
-        "valence": (row.get("Valence") or "").strip(),
-        "tempo": (row.get("Tempo") or "").strip(),
-        "time_signature": (row.get("Time Signature") or "").strip(),
-    }
-    
-    # Only include non-empty fields
-    return {k: v for k, v in metadata.items() if v}
+# Output field -> Exportify CSV column(s); with two columns the first non-empty one wins.
+_CSV_FIELDS = (
+    ("artist", ("Artist Name(s)", "Artist")),
+    ("track", ("Track Name", "Track")),
+    ("album", ("Album Name",)),
+    ("uri", ("Track URI",)),
+    # Extended metadata
+    ("release_date", ("Release Date",)),
+    ("genres", ("Genres",)),
+    ("record_label", ("Record Label",)),
+    ("duration_ms", ("Duration (ms)",)),
+    ("popularity", ("Popularity",)),
+    ("explicit", ("Explicit",)),
+    # Audio analysis features (if available)
+    ("danceability", ("Danceability",)),
+    ("energy", ("Energy",)),
+    ("key", ("Key",)),
+    ("loudness", ("Loudness",)),
+    ("mode", ("Mode",)),
+    ("speechiness", ("Speechiness",)),
+    ("acousticness", ("Acousticness",)),
+    ("instrumentalness", ("Instrumentalness",)),
+    ("liveness", ("Liveness",)),
+    ("valence", ("Valence",)),
+    ("tempo", ("Tempo",)),
+    ("time_signature", ("Time Signature",)),
+)
+
+
+def _csv_columns(header: list) -> list:
+    """Resolve _CSV_FIELDS against a CSV header once, as [(field, (index, ...)), ...]."""
+    # Like csv.DictReader, a repeated column name resolves to its last occurrence.
+    positions = {name: i for i, name in enumerate(header)}
+    columns = []
+    for field, names in _CSV_FIELDS:
+        indices = tuple(positions[name] for name in names if name in positions)
+        if indices:
+            columns.append((field, indices))
+    return columns
+
+
+def _csv_value(row: list, size: int, indices: tuple) -> str:
+    """Return the first non-empty cell among indices, stripped ("" if none)."""
+    for i in indices:
+        if i < size and row[i]:
+            return row[i].strip()
+    return ""
 
 
 def _extract_json_metadata(track: dict) -> dict:
@@ -91,31 +117,81 @@ def _extract_json_metadata(track: dict) -> dict:
     return {k: v for k, v in metadata.items() if v}
 
 
+def _iter_exportify_tracks(csv_file: str):
+    """Yield track dicts from an Exportify CSV; parse errors propagate to the caller."""
+    # utf-8-sig handles the BOM that Exportify often includes.
+    with open(csv_file, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = _csv_columns(header)
+        by_field = dict(columns)
+        track_cols = by_field.get("track")
+        artist_cols = by_field.get("artist")
+        if not track_cols or not artist_cols:
+            return
+        rest = [c for c in columns if c[0] not in ("artist", "track")]
+        value_of = _csv_value
+        normalize_artists = _normalize_artists
+
+        for row in reader:
+            # Skip rows missing a title or artist before touching any other column.
+            size = len(row)
+            track = value_of(row, size, track_cols)
+            if not track:
+                continue
+            artist = value_of(row, size, artist_cols)
+            if not artist:
+                continue
+
+            metadata = {"artist": normalize_artists(artist), "track": track}
+            for field, indices in rest:
+                value = value_of(row, size, indices)
+                if value:
+                    metadata[field] = value
+            yield metadata
+
+
+@lru_cache(maxsize=128)
+def _load_exportify_cached(csv_file: str, mtime_ns: int, size: int) -> tuple:
+    """Parse an Exportify CSV once per (path, mtime, size); a changed file gets a new key."""
+    return tuple(_iter_exportify_tracks(csv_file))
+
+
+def _exportify_tracks_cached(csv_file: str) -> list:
+    """Return the tracks of an Exportify CSV, reparsing only if the file changed since last time."""
+    st = os.stat(csv_file)
+    # Shallow copies, so callers can edit track dicts without touching the cache.
+    return [dict(t) for t in _load_exportify_cached(csv_file, st.st_mtime_ns, st.st_size)]
+
+
+def _dedupe_tracks(tracks, seen: set):
+    """Yield tracks whose casefolded (artist, track) key is not yet in seen, adding new keys."""
+    for t in tracks:
+        # Interned so duplicate artists across CSVs share one string in the seen set.
+        key = (sys.intern(t["artist"].casefold()), sys.intern(t["track"].casefold()))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield t
+
+
 def load_exportify_tracks(csv_file: str):
-    """Load a single Exportify CSV into a flat list of track dicts with comprehensive metadata."""
-    tracks = []
+    """Load a single Exportify CSV into a flat list of track dicts with comprehensive metadata.
 
+    Parsed files are cached by path, mtime and size, so an untouched CSV is not reparsed.
+    """
     if not csv_file or not os.path.exists(csv_file):
         log_warning(f"CSV file not found: {csv_file}")
-        return tracks
+        return []
 
     try:
-        # utf-8-sig handles the BOM that Exportify often includes.
-        with open(csv_file, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                metadata = _extract_csv_metadata(row)
-                
-                if not metadata.get("artist") or not metadata.get("track"):
-                    continue
-
-                tracks.append(metadata)
+        return _exportify_tracks_cached(csv_file)
     except Exception as e:
         log_error(f"Error reading CSV file {csv_file}: {e}")
         return []
 
-    return tracks
-
 
 def load_primary_tracks(config: dict):
     """Load tracks based on configured primary input source, falling back to tracks_file."""
@@ -131,16 +207,14 @@ def load_primary_tracks(config: dict):
         if exportify_dir and os.path.exists(exportify_dir):
             merged = []
             seen = set()
-            for filename in sorted(os.listdir(exportify_dir)):
-                if not filename.lower().endswith(".csv"):
-                    continue
-                for t in load_exportify_tracks(os.path.join(exportify_dir, filename)):
-                    # Use canonical key for deduplication
-                    key = f"{t.get('artist','').casefold()}|{t.get('track','').casefold()}"
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    merged.append(t)
+            with os.scandir(exportify_dir) as it:
+                csv_paths = sorted(e.path for e in it if e.name.endswith(CSV_SUFFIXES) and e.is_file())
+            for path in csv_paths:
+                # Parsed CSVs come from the mtime-keyed cache; duplicates across files are dropped.
+                try:
+                    merged.extend(_dedupe_tracks(_exportify_tracks_cached(path), seen))
+                except Exception as e:
+                    log_error(f"Error reading CSV file {path}: {e}")
             if merged:
                 return merged
 
@@ -148,6 +222,50 @@ def load_primary_tracks(config: dict):
     return load_tracks((config or {}).get("tracks_file", "data/tracks.json"))
 
 
+def tracks_log_path(tracks_file: str) -> str:
+    """Return the append-only NDJSON log that sits next to a tracks JSON file."""
+    return f"{os.path.splitext(tracks_file)[0]}.log.ndjson"
+
+
+def _log_track_key(track: dict) -> tuple:
+    return ((track.get("artist") or "").casefold(), (track.get("track") or "").casefold())
+
+
+def load_tracks_log(tracks_file: str, base_tracks=None) -> list:
+    """Replay tracks appended to the NDJSON log since tracks_file was last compacted.
+
+    Sync only logs tracks missing from tracks_file, so any entry already in base_tracks is a
+    leftover from a compaction interrupted between rewriting tracks_file and removing the
+    log; such entries are dropped instead of being replayed twice.
+    """
+    log_path = tracks_log_path(tracks_file)
+    if not os.path.exists(log_path):
+        return []
+
+    tracks = []
+    try:
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    track = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append; skip it.
+                    continue
+                if isinstance(track, dict):
+                    tracks.append(track)
+    except IOError as e:
+        log_error(f"Error reading tracks log {log_path}: {e}")
+        return []
+
+    if tracks and base_tracks:
+        in_base = {_log_track_key(t) for t in base_tracks if isinstance(t, dict)}
+        tracks = [t for t in tracks if _log_track_key(t) not in in_base]
+    return tracks
+
+
 def load_tracks(tracks_file):
     """Load tracks with enhanced metadata extraction."""
     # Allow tracks_file to be a CSV directly (Exportify format)
@@ -155,14 +273,15 @@ def load_tracks(tracks_file):
         return load_exportify_tracks(tracks_file)
 
     try:
-        import json
-        with open(tracks_file, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-            
+        json_data = _read_json_file(tracks_file)
+
         tracks_data = json_data.get("tracks", [])
         if not isinstance(tracks_data, list):
             log_warning(f"Unexpected tracks format in {tracks_file}")
             return []
+
+        # Tracks added by sync since the last compaction live in the sibling log.
+        tracks_data = tracks_data + load_tracks_log(tracks_file, tracks_data)
             
         # Extract metadata from each track
         tracks = []
@@ -179,11 +298,9 @@ def load_tracks(tracks_file):
 
 def load_playlists(playlists_file):
     """Load playlists with enhanced metadata extraction."""
-    import json
     try:
-        with open(playlists_file, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-            
+        json_data = _read_json_file(playlists_file)
+
         playlists_data = json_data.get("playlists", [])
         if not isinstance(playlists_data, list):
             log_warning(f"Unexpected playlists format in {playlists_file}")
@@ -216,39 +333,33 @@ def load_playlists(playlists_file):
         return []
 
 
+def _parse_one_csv(playlist_path: str):
+    """Parse one Exportify CSV into a playlist dict, or None if it is empty or unreadable."""
+    try:
+        tracks = _exportify_tracks_cached(playlist_path)
+    except Exception as e:
+        log_error(f"Error reading CSV file {playlist_path}: {e}")
+        return None
+
+    if not tracks:
+        return None
+    return {"name": os.path.splitext(os.path.basename(playlist_path))[0], "tracks": tracks}
+
+
 def load_exportify_playlists(exportify_dir="data/exportify"):
     """
     Scans the exportify folder for CSV files and parses them into playlist dicts.
     Each playlist dict includes comprehensive metadata.
     """
-    playlists = []
     if not os.path.exists(exportify_dir):
-        return playlists
-
-    for file in os.listdir(exportify_dir):
-        if not file.lower().endswith(".csv"):
-            continue
-
-        playlist_name = os.path.splitext(file)[0]
-        playlist_path = os.path.join(exportify_dir, file)
-
-        tracks = []
-        try:
-            # utf-8-sig handles Exportify BOM
-            with open(playlist_path, newline="", encoding="utf-8-sig") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    metadata = _extract_csv_metadata(row)
-                    if metadata.get("artist") and metadata.get("track"):
-                        tracks.append(metadata)
-        except Exception as e:
-            log_error(f"Error reading CSV file {playlist_path}: {e}")
-            continue
+        return []
 
-        if tracks:
-            playlists.append({"name": playlist_name, "tracks": tracks})
+    with os.scandir(exportify_dir) as it:
+        paths = [e.path for e in it if e.name.endswith(CSV_SUFFIXES)]
 
-    return playlists
+    # Parsed serially: the CSV parser holds the GIL, so a thread pool only added overhead,
+    # and unchanged files come straight from the mtime-keyed cache anyway.
+    return [p for p in map(_parse_one_csv, paths) if p]
 
 
 def enrich_with_musicbrainz(tracks: list, config: dict) -> list:
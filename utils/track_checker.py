@@ -1,106 +1,198 @@
 import os
-import json
+from functools import lru_cache
+from sys import intern
+from constants import VALID_AUDIO_EXTENSIONS
 from utils.logger import log_info
 
-def check_downloaded_files(output_dir, tracks):
+
+# Characters that are unsafe in file and folder names on common filesystems (Windows is the strictest).
+_SANITIZE_TABLE = str.maketrans({c: "-" for c in '/\\:*?"<>|'})
+
+
+def sanitize_playlist_name(name):
+    """Folder name used for a playlist under output_dir."""
+    return (name or "").translate(_SANITIZE_TABLE).strip()
+
+
+def resolve_playlist_dir(output_dir, name):
+    """Folder for a playlist under output_dir.
+
+    Folders created before sanitize_playlist_name only had "/" replaced (e.g. "Rock: Best");
+    such a folder is reused when it exists and the current name does not.
+    """
+    path = os.path.join(output_dir, sanitize_playlist_name(name))
+    legacy = os.path.join(output_dir, (name or "").replace("/", "-").strip())
+    if legacy != path and not os.path.isdir(path) and os.path.isdir(legacy):
+        return legacy
+    return path
+
+
+def sanitize_filename(artist, track):
+    """Base filename (no extension) a track is downloaded to; the single source of truth for writers and checkers."""
+    return f"{artist} - {track}".translate(_SANITIZE_TABLE)
+
+
+def track_key(track):
+    """Canonical, case-insensitive key for a track, matching the `Artist - Track` file stem it downloads to."""
+    artist = (track.get("artist") or "").strip()
+    name = (track.get("track") or "").strip()
+    return sanitize_filename(artist, name).casefold()
+
+
+def _key_from_filename(filename):
+    """Return the track key for an audio filename, or None for non-audio files."""
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() not in VALID_AUDIO_EXTENSIONS:
+        return None
+    # Files saved before sanitize_filename only had "/" replaced; translating the stem
+    # maps those legacy names onto the same key as the current ones.
+    return stem.translate(_SANITIZE_TABLE).strip().casefold()
+
+
+def existing_track_keys_in_dir(dir_path):
+    """Return the set of track keys for audio files already present in dir_path (non-recursive)."""
+    keys = set()
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                key = _key_from_filename(entry.name)
+                if key:
+                    keys.add(key)
+    except OSError:
+        # Missing or unreadable folder: nothing downloaded yet.
+        pass
+    return keys
+
+
+@lru_cache(maxsize=512)
+def _cached_existing_keys(dir_path, mtime_ns):
+    return frozenset(existing_track_keys_in_dir(dir_path))
+
+
+def existing_track_keys_cached(dir_path):
+    """Like existing_track_keys_in_dir, but memoized on the folder's mtime.
+
+    Adding, removing or renaming a file bumps the folder mtime, so the cache
+    invalidates itself after downloads. Returns a frozenset.
+    """
+    try:
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        # Missing, not a directory, or unreadable: nothing downloaded there.
+        return frozenset()
+    return _cached_existing_keys(dir_path, mtime_ns)
+
+
+def count_existing_for_tracks(dir_path, track_keys):
+    """Count how many of track_keys already have an audio file in dir_path.
+
+    Goes through the mtime-keyed cache, so a following song selection for the
+    same folder reuses the scan instead of listing the directory again.
+    """
+    return len(existing_track_keys_cached(dir_path).intersection(track_keys))
+
+# Below this many tracks, stat each expected file instead of listing the whole folder.
+_STAT_LOOKUP_MAX_TRACKS = 32
+
+
+def _expected_filename(track):
+    return f"{sanitize_filename(track['artist'], track['track'])}.mp3"
+
+
+def _legacy_filename(track):
+    """Name the downloader used before sanitize_filename, when only "/" was replaced."""
+    return f"{track['artist']} - {track['track']}.mp3".replace("/", "-")
+
+
+def _existing_filenames(dir_path, filenames):
+    """Names in dir_path to test filenames against: stats each one for short lists, lists the folder otherwise."""
+    if len(filenames) < _STAT_LOOKUP_MAX_TRACKS:
+        return {name for name in filenames if os.path.isfile(os.path.join(dir_path, name))}
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        # Missing or unreadable folder: nothing downloaded yet.
+        return set()
+
+
+def _partition_by_existing(dir_path, tracks):
+    """Split tracks into (downloaded, pending), keeping their order and any duplicates."""
+    filenames = [_expected_filename(track) for track in tracks]
+    expected = frozenset(filenames)
+
+    # A file saved under its legacy name counts as downloaded too.
+    legacy = {}
+    for track, filename in zip(tracks, filenames):
+        old = _legacy_filename(track)
+        if old != filename:
+            legacy[old] = filename
+
+    found = _existing_filenames(dir_path, list(expected.union(legacy)) if legacy else filenames)
+    have = expected.intersection(found)
+    if legacy:
+        have = have.union(legacy[name] for name in found if name in legacy)
+
+    # The set intersection settles the common all/none cases without a per-track loop.
+    if not have:
+        return [], list(tracks)
+    if len(have) == len(expected):
+        return list(tracks), []
+
     downloaded = []
     pending = []
+    for track, filename in zip(tracks, filenames):
+        (downloaded if filename in have else pending).append(track)
+    return downloaded, pending
+
+
+def check_downloaded_files(output_dir, tracks):
     try:
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"utils/track_checker.py:14","message":"created output_dir","data":{"output_dir":output_dir},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        existing_files = set(os.listdir(output_dir))
-    except Exception as e:
-        existing_files = set()  # Return empty set if directory doesn't exist or can't be read
-
-    for track in tracks:
-        filename = f"{track['artist']} - {track['track']}.mp3".replace("/", "-")
-        if filename in existing_files:
-            downloaded.append(track)
-        else:
-            pending.append(track)
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError:
+        pass
+
+    downloaded, pending = _partition_by_existing(output_dir, tracks)
 
     log_info(f"Downloaded: {len(downloaded)} tracks, Pending: {len(pending)} tracks")
     return len(downloaded), pending
 
 
-"""
+def _playlist_tracks(pl):
+    """Tracks of a playlist in either Exportify ("tracks") or Spotify export ("items") shape."""
+    tracks = pl.get("tracks")
+    if isinstance(tracks, list) and tracks:
+        first = tracks[0]
+        if isinstance(first, dict) and "artist" in first and "track" in first:
+            return tracks
+
+    # Interned: the same artist (and often title) recurs across playlists, so repeats share one string.
+    return [
+        {
+            "artist": intern(str(item["track"]["artistName"])),
+            "track": intern(str(item["track"]["trackName"]))
+        }
+        for item in pl.get("items", [])
+        if item.get("track")
+    ]
+
+
+def check_downloaded_playlists(output_dir, playlists):
+    """
     Checks which playlists and tracks have already been downloaded.
     Returns:
         downloaded_playlists: list of dicts with playlist info and downloaded tracks
         pending_playlists: list of dicts with playlist info and pending tracks
     """
-def check_downloaded_playlists(output_dir, playlists):
-    # #region agent log
-    with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-        f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:26","message":"check_downloaded_playlists entry","data":{"output_dir":output_dir,"playlists_count":len(playlists) if playlists else 0},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-    # #endregion
     downloaded_playlists = []
     pending_playlists = []
 
     for pl in playlists:
-        # #region agent log
-        with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:32","message":"processing playlist","data":{"playlist_name":pl.get("name","unknown"),"has_items":bool(pl.get("items")),"has_tracks":bool(pl.get("tracks")),"pl_keys":list(pl.keys())},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        # #endregion
         playlist_name = pl["name"]
-        sanitized_name = playlist_name.replace("/", "-").strip()
-        playlist_dir = os.path.join(output_dir, sanitized_name)
-
-        # #region agent log
-        try:
-            items = pl.get("items", [])
-            tracks_direct = pl.get("tracks", [])
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:36","message":"before track extraction","data":{"has_items":bool(items),"has_tracks_direct":bool(tracks_direct),"items_count":len(items) if items else 0,"tracks_count":len(tracks_direct) if tracks_direct else 0},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        except Exception as e:
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:36","message":"error accessing playlist structure","data":{"error":str(e),"error_type":type(e).__name__},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        # #endregion
-
-        # #region agent log
-        try:
-            # Check if playlist has direct "tracks" array (Exportify format)
-            if pl.get("tracks") and isinstance(pl.get("tracks"), list) and len(pl.get("tracks", [])) > 0:
-                first_track = pl.get("tracks")[0]
-                if isinstance(first_track, dict) and "artist" in first_track and "track" in first_track:
-                    tracks = pl.get("tracks", [])
-                    with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                        f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:70","message":"using direct tracks structure","data":{"tracks_count":len(tracks)},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-                else:
-                    # Try items structure
-                    tracks = [
-                        {
-                            "artist": item["track"]["artistName"],
-                            "track": item["track"]["trackName"]
-                        }
-                        for item in pl.get("items", [])
-                        if item.get("track")
-                    ]
-                    with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                        f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:82","message":"using items structure","data":{"tracks_count":len(tracks)},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-            else:
-                # Use items structure (Spotify export format)
-                tracks = [
-                    {
-                        "artist": item["track"]["artistName"],
-                        "track": item["track"]["trackName"]
-                    }
-                    for item in pl.get("items", [])
-                    if item.get("track")
-                ]
-                with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                    f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:95","message":"using items structure (no tracks key)","data":{"tracks_count":len(tracks)},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        except KeyError as e:
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"utils/track_checker.py:97","message":"KeyError during track extraction","data":{"error":str(e),"error_type":type(e).__name__,"pl_structure":str(pl)[:200]},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-            raise
-        except Exception as e:
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"utils/track_checker.py:100","message":"unexpected error during track extraction","data":{"error":str(e),"error_type":type(e).__name__},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-            raise
-        # #endregion
+        playlist_dir = resolve_playlist_dir(output_dir, playlist_name)
+        tracks = _playlist_tracks(pl)
 
         if not os.path.exists(playlist_dir):
             log_info(f"Playlist folder missing: {playlist_name}")
@@ -110,25 +202,7 @@ def check_downloaded_playlists(output_dir, playlists):
             })
             continue
 
-        # #region agent log
-        try:
-            existing_files = set(os.listdir(playlist_dir))
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"utils/track_checker.py:103","message":"os.listdir succeeded for playlist","data":{"playlist_dir":playlist_dir,"file_count":len(existing_files)},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-        except Exception as e:
-            with open('/Users/saadaboussabr/Desktop/Archive/Temp/spotify-yt-dlp-downloader/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"utils/track_checker.py:103","message":"os.listdir failed for playlist","data":{"playlist_dir":playlist_dir,"error":str(e),"error_type":type(e).__name__},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-            raise
-        # #endregion
-        downloaded_tracks = []
-        pending_tracks = []
-
-        for track in tracks:
-            filename = f"{track['artist']} - {track['track']}.mp3".replace("/", "-")
-            if filename in existing_files:
-                downloaded_tracks.append(track)
-            else:
-                pending_tracks.append(track)
+        downloaded_tracks, pending_tracks = _partition_by_existing(playlist_dir, tracks)
 
         log_info(f"{playlist_name} → Downloaded: {len(downloaded_tracks)}, Pending: {len(pending_tracks)}")
 
@@ -143,4 +217,4 @@ def check_downloaded_playlists(output_dir, playlists):
                 "tracks": downloaded_tracks
             })
 
-    return downloaded_playlists, pending_playlists
\ No newline at end of file
+    return downloaded_playlists, pending_playlists